@@ -0,0 +1,300 @@
+"""Micro-benchmarks of the game core, without a running oTree server
+
+Run from the oTree project directory:
+
+    python -m BaseExperiment.benchmark          # compare against the stored baseline
+    python -m BaseExperiment.benchmark --save   # store the results as new baseline
+
+oTree models are replaced by lightweight stand-ins, so only the code of this app is measured.
+Reports operations per second and bytes allocated by a single operation.
+
+The speed of a machine varies from run to run, here by up to 70% between runs of an unchanged tree,
+so each round of a case is followed by a round of a fixed calibration workload, and cases are compared
+by their speed relative to it: the median over ROUNDS rounds of case ops / calibration ops.
+Update the baseline only in a commit of its own, saying why the new speed is expected.
+"""
+import argparse
+import decimal
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+baselinefile = Path(__file__).parent / "benchmark_baseline.json"
+
+# slowdown of the relative speed tolerated before reporting a regression; the median relative speed
+# of separate runs of an unchanged tree differs by up to 15% (the plain ops/s by up to 70%)
+SLOWDOWN = 1.25
+# allocation growth tolerated, allocations hardly differ between runs
+GROWTH = 1.25
+ROUNDS = 15
+# operations per timing batch
+BATCH = 100
+
+
+# Stand-ins for otree.api
+
+class Currency(decimal.Decimal):
+    pass
+
+
+def field(*args, initial=None, **kwargs):
+    return initial
+
+
+class Query:
+    """Queried rows; updates are not measured, like save(), as the rows are the objects in use"""
+
+    def update(self, **values):
+        return 0
+
+
+class Manager:
+    """In-memory replacement of a model manager"""
+
+    def __init__(self, model):
+        self.model = model
+        self.rows = []
+
+    def create(self, **values):
+        obj = self.model()
+        obj.__dict__.update(values)
+        # set after the fields, setting it first slows down attribute access of the object
+        obj.pk = len(self.rows) + 1
+        self.rows.append(obj)
+        return obj
+
+    def filter(self, **lookup):
+        return Query()
+
+    def get(self, **lookup):
+        for obj in self.rows:
+            if all(getattr(obj, key) is value for key, value in lookup.items()):
+                return obj
+        raise LookupError(lookup)
+
+
+class Model:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.objects = Manager(cls)
+
+    def save(self):
+        pass
+
+    @classmethod
+    def add_to_class(cls, name, value):
+        setattr(cls, name, value)
+
+
+def install_standins():
+    """Registers stand-in otree.api module"""
+    api = types.ModuleType("otree.api")
+    api.models = types.SimpleNamespace(
+        StringField=field, LongStringField=field, IntegerField=field, FloatField=field,
+        BooleanField=field, CurrencyField=field, Link=field,
+    )
+    api.widgets = types.SimpleNamespace(RadioSelect=None, RadioSelectHorizontal=None)
+    api.BaseConstants = object
+    api.BaseSubsession = api.BaseGroup = api.BasePlayer = api.ExtraModel = Model
+    api.Currency = Currency
+    package = types.ModuleType("otree")
+    package.__path__ = []
+    package.api = api
+    sys.modules["otree"] = package
+    sys.modules["otree.api"] = api
+
+
+def make_player(models, pk, seed=0):
+    session = types.SimpleNamespace(
+        config=dict(flush_every=20, flush_interval=10, P1_price_min=1, P1_price_max=1),
+        vars=dict(order_seed=seed),
+        code='benchmark',
+    )
+    subsession = models.Subsession()
+    subsession.session = session
+    player = models.Player()
+    player.id = pk
+    player.session_id = 1
+    player.session = session
+    player.id_in_group = 1
+    player.price = Currency(1)
+    player.subsession = subsession
+    stream = models.order_stream(f"{seed}:{pk}", models.Constants.max_orders, models.MENU)
+    models.GameSession.objects.create(player=player, orders=models.pack_stream(stream), cursor=0)
+    return player
+
+
+def sandwich(recipes, order):
+    return [recipes.NAMES.index(item) for item in recipes.RECIPES[order]]
+
+
+# Benchmarks
+
+def cases():
+    """Returns: name -> function running one operation"""
+    from . import events, models, recipes
+
+    # the live path only queues event records, they are written by the event log thread,
+    # measured on its own by EventLog.write; here no thread is started and the records are written on demand
+    log = models.EVENTS = events.EventLog(tempfile.mkdtemp())
+    log.start = lambda: None
+
+    player = make_player(models, 1)
+    subsession = player.subsession
+    game = subsession.start(player)
+    sandwiches = {name: sandwich(recipes, name) for name in recipes.RECIPES}
+    valid = sandwiches[game.ordered]
+    wrong = valid[1:]
+
+    def validate():
+        game.validate(valid)
+
+    def validate_invalid():
+        game.validate(wrong)
+
+    def next_order():
+        game.next_order(player.price)
+
+    plays = 0
+
+    def play():
+        nonlocal plays
+        plays += 1
+        if plays % models.Constants.max_orders == 0:
+            # a round has at most max_orders orders, so the packed order times stay that short
+            subsession.leave(player)
+            player.reset_after_practice()
+            subsession.start(player)
+            log.pending.clear()
+        subsession.play(player, sandwiches[subsession.game(player).ordered])
+
+    def write_events():
+        log.emit('benchmark', 'submission', player=1, order=game.ordered, components=valid, valid=True, mismatches=0)
+        if len(log.pending) >= 100:
+            log.write()
+
+    def load_recipes():
+        recipes.load_recipes()
+
+    def load_compiled():
+        recipes.load_compiled()
+
+    def images_map():
+        recipes.images_map(recipes.INGREDIENTS, recipes.MANIFEST)
+
+    return {
+        'GameSession.validate (valid)': validate,
+        'GameSession.validate (invalid)': validate_invalid,
+        'GameSession.next_order': next_order,
+        'Subsession.play': play,
+        'EventLog.write': write_events,
+        'recipes.load_recipes': load_recipes,
+        'recipes.load_compiled': load_compiled,
+        'recipes.images_map': images_map,
+    }
+
+
+CALIBRATION = [(i * 7919) % 104729 for i in range(64)]
+
+
+def calibrate():
+    """Fixed pure-Python work, timed after each round of a case as the speed of the machine at the time"""
+    table = {}
+    for i, value in enumerate(CALIBRATION):
+        table[value % 61] = table.get(value % 61, 0) + i
+    return sorted(table.items())
+
+
+def timed(func, seconds):
+    """Returns: operations per second of func run in batches for seconds"""
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while True:
+        for _ in range(BATCH):
+            func()
+        count += BATCH
+        now = time.perf_counter()
+        if now >= deadline:
+            return count / (now - started)
+
+
+def measure(func, seconds=0.5, rounds=ROUNDS):
+    """Returns: median operations per second over rounds sharing seconds,
+    bytes allocated by one operation (the least of rounds operations, as some also flush),
+    median speed relative to the calibration rounds
+    """
+    func()  # warm up caches
+    speeds = []
+    relative = []
+    for _ in range(rounds):
+        ops = timed(func, seconds / rounds)
+        speeds.append(ops)
+        relative.append(ops / timed(calibrate, seconds / rounds))
+
+    tracemalloc.start()
+    allocated = []
+    for _ in range(rounds):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        allocated.append(peak - before)
+    tracemalloc.stop()
+    return statistics.median(speeds), min(allocated), statistics.median(relative)
+
+
+def compare(results, baseline):
+    """Returns: list of regression descriptions"""
+    regressions = []
+    for name, (ops, alloc, relative) in results.items():
+        if name not in baseline:
+            continue
+        base_ops, base_alloc, base_relative = baseline[name]
+        if relative * SLOWDOWN < base_relative:
+            regressions.append(f"{name}: {relative:.4f} x calibration ({ops:,.0f} ops/s), "
+                               f"baseline {base_relative:.4f} x ({base_ops:,.0f} ops/s)")
+        if alloc > base_alloc * GROWTH + 64:
+            regressions.append(f"{name}: {alloc} bytes/op, baseline {base_alloc}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--seconds", type=float, default=0.5, help="duration of each benchmark")
+    args = parser.parse_args(argv)
+
+    install_standins()
+    # event log of the benchmarked games goes to a throwaway directory
+    os.environ.setdefault("EVENT_LOG_DIR", tempfile.mkdtemp())
+    results = {}
+    for name, func in cases().items():
+        results[name] = measure(func, args.seconds)
+        ops, alloc, relative = results[name]
+        print(f"{name:35} {ops:>14,.0f} ops/s {alloc:>10} bytes/op {relative:>10.4f} x calibration")
+
+    if args.save:
+        with open(baselinefile, "w") as f:
+            json.dump(results, f, indent=1)
+        print(f"baseline saved to {baselinefile.name}")
+        return 0
+
+    if not baselinefile.exists():
+        print("no baseline stored, run with --save")
+        return 0
+    with open(baselinefile) as f:
+        regressions = compare(results, json.load(f))
+    for line in regressions:
+        print("REGRESSION", line)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Capacity check: runs the bot suite for several sessions at once
+
+Run from the oTree project directory, against a running server:
+
+    otree prodserver 8000        # in another shell, with the production database
+    python -m BaseExperiment.botrun --sessions 8 --participants 2 --server-url http://127.0.0.1:8000
+
+Each session is started with `otree browser_bots` on that server, all at the same time,
+so the wall time is that of one server handling the sessions together, live messages included.
+Browser bots run in a browser opened on each session; set OTREE_REST_KEY as for the server
+when it requires authentication.
+
+Without --server-url, every session is a separate `otree test` process, each with its own
+in-process server and test database. The wall time then only measures the throughput of
+one process per session, not the capacity of a server; use it to compare changes on one machine.
+"""
+import argparse
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def command(config, participants, server_url=None):
+    """Returns: command running bots of one session, on the server at server_url if given"""
+    if server_url is None:
+        return ["otree", "test", config, str(participants)]
+    return ["otree", "browser_bots", config, str(participants), "--server-url", server_url]
+
+
+def run_session(config, participants, server_url=None):
+    """Runs bots of one session
+    Returns: success, seconds taken, output
+    """
+    started = time.monotonic()
+    proc = subprocess.run(
+        command(config, participants, server_url),
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True,
+    )
+    return proc.returncode == 0, time.monotonic() - started, proc.stdout
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--config", default="BasicExperiment")
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--participants", type=int, default=2)
+    parser.add_argument("--server-url", help="running server to start the sessions on")
+    args = parser.parse_args(argv)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(args.sessions) as pool:
+        results = list(pool.map(
+            lambda _: run_session(args.config, args.participants, args.server_url), range(args.sessions)))
+    wall = time.monotonic() - started
+
+    failed = 0
+    for i, (ok, seconds, output) in enumerate(results, 1):
+        print(f"session {i}: {'ok' if ok else 'FAILED'} in {seconds:.1f}s")
+        if not ok:
+            failed += 1
+            print(output)
+    where = f"on {args.server_url}" if args.server_url else "in separate processes (not one server's capacity)"
+    print(f"{args.sessions} sessions x {args.participants} participants {where}: "
+          f"{wall:.1f}s wall time, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Static menu bundle shared by the shop pages
+
+The bundle is a content-hashed script, static/sandwiches/menu.<hash>.js, defining the menu,
+ingredient ids and images as window.MENU. It is built, and older bundles removed, by running
+from the oTree project directory after changing the menu or the images:
+
+    python -m BaseExperiment.bundle
+
+(also after the image build step, as image urls are part of the bundle).
+Importing this module only computes the name of the bundle for the current menu;
+it never writes, so workers can run from a read-only tree.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+from .recipes import RECIPES, INGREDIENTS, MANIFEST, MENU, NAMES, WIRE_VERSION, images_map
+
+
+bundledir = Path(__file__).parent / "static" / "sandwiches"
+
+
+def bundle_source(data):
+    """Script defining the menu data as window.MENU"""
+    return "window.MENU = " + json.dumps(data, separators=(",", ":")) + ";\n"
+
+
+def build_source():
+    """Returns: file name and source of the bundle of the current menu"""
+    data = dict(
+        version=WIRE_VERSION,
+        menu=RECIPES,
+        orders=MENU,
+        ingredients=NAMES,
+        images=images_map(INGREDIENTS, MANIFEST),
+    )
+    source = bundle_source(data)
+    digest = hashlib.sha1(source.encode()).hexdigest()[:12]
+    return f"menu.{digest}.js", source
+
+
+def write_bundle():
+    """Writes the bundle of the current menu and removes the others
+    Returns: static path of the bundle
+    """
+    name, source = build_source()
+    path = bundledir / name
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(source)
+    tmp.replace(path)
+    for old in bundledir.glob("menu.*.js"):
+        if old != path:
+            old.unlink()
+    return f"sandwiches/{name}"
+
+
+def bundle_path():
+    """Static path of the bundle of the current menu
+    Raises RuntimeError if it was not built, as pages would serve an outdated menu
+    """
+    name, _ = build_source()
+    if not (bundledir / name).exists():
+        raise RuntimeError(f"Menu bundle {name} is missing or outdated, run: python -m BaseExperiment.bundle")
+    return f"sandwiches/{name}"
+
+
+if __name__ == "__main__":
+    print(f"bundle {write_bundle()}")
+else:
+    BUNDLE = bundle_path()
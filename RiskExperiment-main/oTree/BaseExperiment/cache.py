@@ -0,0 +1,108 @@
+"""Process-local game state"""
+import threading
+import time
+
+from .timings import OrderTimes
+
+
+class GameCache:
+    """Per-player store of live game objects.
+    Keeps the current game of each player in memory, so that live messages
+    do not have to query the database. Entries are loaded lazily on a miss
+    and evicted when the player leaves the live page, or when unused for a while (see idle).
+    """
+
+    def __init__(self):
+        self._games = {}
+        # key -> monotonic time of the last get
+        self._used = {}
+
+    def get(self, key, load):
+        """Returns cached game for key, calling load() on a miss"""
+        self._used[key] = time.monotonic()
+        game = self._games.get(key)
+        if game is None:
+            game = self._games[key] = load()
+        return game
+
+    def evict(self, key):
+        """Drops cached game for key
+        Returns: the dropped game or None
+        """
+        self._used.pop(key, None)
+        return self._games.pop(key, None)
+
+    def items(self):
+        """Returns: list of (key, game), safe to iterate while other threads use the cache"""
+        return list(self._games.items())
+
+    def idle(self, seconds):
+        """Returns: keys not used for seconds"""
+        now = time.monotonic()
+        return [key for key, used in list(self._used.items()) if now - used >= seconds]
+
+    def __contains__(self, key):
+        return key in self._games
+
+    def __len__(self):
+        return len(self._games)
+
+
+class Metrics:
+    """Shop manager counters accumulated in memory between writes.
+    A snapshot of the counters is taken for a write when `every` messages have come in since the last one,
+    or `interval` seconds have passed with messages pending, checked on each message and by a timer
+    (see models.sweep); they are copied to the player only when it leaves the page.
+    Updates and snapshots hold `lock`, as the timer runs on another thread.
+    Completion time and failed attempts of each order are appended to `timings`.
+    """
+    FIELDS = ('performed', 'revenue', 'errors', 'mismatches', 'ordertimes')
+
+    def __init__(self, player, every, interval):
+        self.performed = player.performed
+        self.revenue = player.revenue
+        self.errors = player.errors
+        self.mismatches = player.mismatches
+        self.timings = OrderTimes(player.ordertimes)
+        # time the current order was issued and invalid submissions for it
+        self.issued_at = None
+        self.attempts = 0
+        self.every = every
+        self.interval = interval
+        self.pending = 0
+        self.flushed_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    @property
+    def ordertimes(self):
+        return self.timings.packed()
+
+    def issued(self):
+        """Starts timing a new order"""
+        self.issued_at = time.monotonic()
+        self.attempts = 0
+
+    def completed(self):
+        """Records the current order as completed"""
+        if self.issued_at is not None:
+            self.timings.append(round((time.monotonic() - self.issued_at) * 1000), self.attempts)
+        self.issued_at = None
+
+    def due(self):
+        """Checks if pending updates should be written"""
+        return self.pending >= self.every or self.overdue()
+
+    def overdue(self):
+        """Checks if updates are pending for interval seconds or more"""
+        return self.pending > 0 and time.monotonic() - self.flushed_at >= self.interval
+
+    def snapshot(self):
+        """Returns: field -> value of the counters, for a write of the player; restarts counting pending updates"""
+        self.pending = 0
+        self.flushed_at = time.monotonic()
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def flush(self, player):
+        """Copies counters to the player, which is to be saved by caller"""
+        for field, value in self.snapshot().items():
+            setattr(player, field, value)
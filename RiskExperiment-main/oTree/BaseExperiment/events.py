@@ -0,0 +1,185 @@
+"""Structured event log of the live game
+
+Every order issued, every sandwich submitted and every live message received
+(for replay, see replay.py) is appended as one JSON line
+to a file per session, events-<session code>.jsonl in EVENT_LOG_DIR (default: _events).
+Files are named by session code, as database ids start over after resetdb.
+Records are appended to an in-memory queue by the request and written in batches
+by a background thread every INTERVAL seconds, so live messages never wait for the disk
+and do not wake the writer one by one. Set EVENT_LOG_DIR to an empty value to disable.
+
+The writer keeps at most MAX_OPEN files open, closing the least recently written one,
+and closes files of sessions idle for IDLE seconds.
+At most MAX_PENDING records are queued; when the writer falls behind, the oldest are dropped.
+Records that cannot be written (e.g. disk full) are dropped too; the writer logs the errors
+and the number of records dropped (`dropped`), and keeps going.
+
+Each record has the session code, a kind and t, a monotonic timestamp in seconds.
+Each time a process opens a file, it first writes a 'clock' record
+holding both the wall clock time and t, to align timestamps across processes.
+"""
+import atexit
+import collections
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# seconds between writes of queued records
+INTERVAL = 0.05
+# queued records at most
+MAX_PENDING = 100000
+# open files at most, and seconds without records after which a file is closed
+MAX_OPEN = 16
+IDLE = 300
+# records hold plain data only, no need to check for cycles
+encode = json.JSONEncoder(check_circular=False).encode
+# session id -> code, for sessions of players seen by this process
+CODES = {}
+
+
+def session_code(player):
+    """Returns: code of the session of player, loaded from the database once per process"""
+    code = CODES.get(player.session_id)
+    if code is None:
+        code = CODES[player.session_id] = player.session.code
+    return code
+
+
+class EventLog:
+    """Append-only event stream written by a background thread"""
+
+    def __init__(self, directory, interval=INTERVAL, max_open=MAX_OPEN, idle=IDLE, max_pending=MAX_PENDING):
+        self.directory = Path(directory) if directory else None
+        self.interval = interval
+        self.max_open = max_open
+        self.idle = idle
+        # (session, kind, t, fields), appended by emit and consumed by the writer; deque operations are atomic
+        self.pending = collections.deque(maxlen=max_pending)
+        # records dropped, and the number of them logged already
+        self.dropped = 0
+        self.reported = 0
+        self.stopping = threading.Event()
+        self.thread = None
+        self.lock = threading.Lock()
+        # session -> [open file, monotonic time of last write], least recently written first
+        self.files = collections.OrderedDict()
+
+    def emit(self, session, kind, **fields):
+        """Queues a record for the log of the session with code session"""
+        if self.directory is None:
+            return
+        if self.thread is None:
+            self.start()
+        if len(self.pending) == self.pending.maxlen:
+            self.dropped += 1
+        self.pending.append((session, kind, time.monotonic(), fields))
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.stopping.clear()
+                self.thread = threading.Thread(target=self.run, name="event-log", daemon=True)
+                self.thread.start()
+
+    def run(self):
+        try:
+            while True:
+                stopping = self.stopping.wait(self.interval)
+                try:
+                    self.write()
+                except Exception:
+                    logger.exception("event log write failed")
+                if self.dropped != self.reported:
+                    logger.error("%d event records dropped", self.dropped - self.reported)
+                    self.reported = self.dropped
+                if stopping:
+                    return
+        finally:
+            for session in list(self.files):
+                self.discard(session)
+
+    def write(self):
+        """Writes all queued records, then flushes the files written and closes idle ones
+        A record failing to be written is dropped, and the file of its session closed, to be opened again.
+        """
+        now = time.monotonic()
+        written = set()
+        error = None
+        while self.pending:
+            session, kind, t, record = self.pending.popleft()
+            record['session'] = session
+            record['kind'] = kind
+            record['t'] = t
+            try:
+                f = self.open(session)
+                f.write(encode(record) + "\n")
+            except (OSError, TypeError, ValueError) as e:
+                self.dropped += 1
+                error = e
+                self.discard(session)
+                continue
+            self.files[session][1] = now
+            written.add(session)
+        for session in written:
+            # files closed meanwhile to stay within max_open are flushed already
+            if session in self.files:
+                try:
+                    self.files[session][0].flush()
+                except OSError as e:
+                    error = e
+                    self.discard(session)
+        for session, (f, last) in list(self.files.items()):
+            if now - last >= self.idle:
+                self.discard(session)
+        if error is not None:
+            logger.error("event log write failed: %s", error)
+
+    def open(self, session):
+        entry = self.files.get(session)
+        if entry is not None:
+            self.files.move_to_end(session)
+            return entry[0]
+        if len(self.files) >= self.max_open:
+            self.discard(next(iter(self.files)))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        f = open(self.path(session), "a")
+        f.write(json.dumps(dict(session=session, kind='clock', t=time.monotonic(), wall=time.time())) + "\n")
+        self.files[session] = [f, time.monotonic()]
+        return f
+
+    def discard(self, session):
+        """Closes the file of the session, if open, ignoring errors of writing out its buffer"""
+        entry = self.files.pop(session, None)
+        if entry is not None:
+            try:
+                entry[0].close()
+            except OSError as e:
+                logger.error("event log of session %s not closed cleanly: %s", session, e)
+
+    def path(self, session):
+        return self.directory / f"events-{session}.jsonl"
+
+    def close(self, timeout=5):
+        """Writes pending records, closes the files and stops the writer"""
+        if self.thread is not None:
+            self.stopping.set()
+            self.thread.join(timeout)
+            self.thread = None
+
+
+def load(path):
+    """Reads a session event log
+    Returns: list of records
+    """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+EVENTS = EventLog(os.environ.get("EVENT_LOG_DIR", "_events"))
+
+atexit.register(EVENTS.close)
@@ -0,0 +1,125 @@
+"""Streaming export of the Player table
+
+Rows are read in chunks of consecutive ids, one query per chunk, and written chunk by chunk,
+so memory use does not grow with the number of participants. Unlike QuerySet.iterator, this needs
+no server-side cursor, which is not available behind pgbouncer (DB_PGBOUNCER, see settings.py).
+Writes CSV, or Parquet/Arrow when pyarrow is installed.
+"""
+import csv
+import decimal
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from .models import Player
+
+# columns joined in from related tables: name, lookup, type
+RELATED = [
+    ('session', 'session__code', 'CharField'),
+    ('participant', 'participant__code', 'CharField'),
+    ('reportingcondition', 'group__reportingcondition', 'CharField'),
+    ('culturecondition', 'group__culturecondition', 'CharField'),
+]
+
+FORMATS = ('csv', 'parquet', 'arrow')
+
+
+def columns():
+    """Columns of the export: name, queryset lookup, django field type
+    Player fields are taken from the model, internal (_) fields and links are skipped.
+    """
+    cols = list(RELATED)
+    for field in Player._meta.concrete_fields:
+        if field.name.startswith('_') or field.is_relation:
+            continue
+        cols.append((field.name, field.attname, field.get_internal_type()))
+    return cols
+
+
+def rows(cols, chunk_size=2000):
+    """Yields: chunks of rows (tuples in order of cols)"""
+    queryset = Player.objects.order_by('id').values_list('id', *[lookup for name, lookup, kind in cols])
+    last = None
+    while True:
+        chunk = list((queryset if last is None else queryset.filter(id__gt=last))[:chunk_size])
+        if not chunk:
+            return
+        last = chunk[-1][0]
+        yield [row[1:] for row in chunk]
+
+
+def arrow_type(kind, field=None):
+    """Arrow type of a django field type"""
+    if kind in ('IntegerField', 'PositiveIntegerField', 'BigIntegerField', 'AutoField', 'SmallIntegerField'):
+        return pyarrow.int64()
+    if kind == 'FloatField':
+        return pyarrow.float64()
+    if kind in ('BooleanField', 'NullBooleanField'):
+        return pyarrow.bool_()
+    if kind == 'DecimalField':
+        return pyarrow.decimal128(field.max_digits, field.decimal_places)
+    return pyarrow.string()
+
+
+def arrow_schema(cols):
+    fields = {field.name: field for field in Player._meta.concrete_fields}
+    return pyarrow.schema([(name, arrow_type(kind, fields.get(name))) for name, lookup, kind in cols])
+
+
+def write_csv(path, cols, chunks):
+    # currency values are written as plain numbers, not formatted amounts
+    decimals = [i for i, (name, lookup, kind) in enumerate(cols) if kind == 'DecimalField']
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([name for name, lookup, kind in cols])
+        count = 0
+        for chunk in chunks:
+            for row in chunk:
+                if decimals:
+                    row = list(row)
+                    for i in decimals:
+                        if row[i] is not None:
+                            row[i] = decimal.Decimal(row[i])
+                writer.writerow(row)
+            count += len(chunk)
+    return count
+
+
+def write_arrow(path, cols, chunks, fmt):
+    schema = arrow_schema(cols)
+    if fmt == 'parquet':
+        writer = pyarrow.parquet.ParquetWriter(path, schema)
+    else:
+        writer = pyarrow.ipc.new_file(path, schema)
+    count = 0
+    try:
+        for chunk in chunks:
+            arrays = [pyarrow.array(values, type=field.type) for values, field in zip(zip(*chunk), schema)]
+            batch = pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+            if fmt == 'parquet':
+                writer.write_table(pyarrow.Table.from_batches([batch]))
+            else:
+                writer.write_batch(batch)
+            count += len(chunk)
+    finally:
+        writer.close()
+    return count
+
+
+def export(path, fmt='csv', chunk_size=2000):
+    """Streams all players into path
+    Returns: number of rows written
+    """
+    if fmt not in FORMATS:
+        raise ValueError("Unknown export format", fmt)
+    if fmt != 'csv' and pyarrow is None:
+        raise ImportError("pyarrow is required for parquet and arrow exports")
+    cols = columns()
+    chunks = rows(cols, chunk_size)
+    if fmt == 'csv':
+        return write_csv(path, cols, chunks)
+    return write_arrow(path, cols, chunks, fmt)
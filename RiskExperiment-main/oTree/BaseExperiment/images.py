@@ -0,0 +1,92 @@
+"""Build step for the sandwich and report images
+
+Run from the oTree project directory after changing any image or ingredient:
+
+    python -m BaseExperiment.images
+
+Requires Pillow (with WebP and AVIF support), which is not needed at runtime.
+Writes into static/sandwiches/build/:
+- a sprite sheet of all ingredient images, resized to sandwich layers, in WebP and in JPEG
+  for browsers without WebP
+- manifest.json with hashed filenames and sprite offsets, read by recipes.images_map
+and WebP/AVIF variants of the _static/global JPEGs next to the originals, for the <picture> elements
+of the report pages.
+Then rebuild the menu bundle (see bundle.py), which refers to the new sprite sheet.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+from PIL import Image, ImageOps
+
+from .recipes import INGREDIENTS, imgdir, builddir, manifestfile
+
+# size of one sandwich layer, see ul.sandwich li in main.css
+TILE = (320, 48)
+
+globaldir = Path(__file__).parent.parent / "_static" / "global"
+
+
+def image_name(ingredient):
+    return ingredient.lower().replace(' ', '_')
+
+
+def save_hashed(image, stem, fmt, **options):
+    """Saves image into build directory with content hash in its name
+    Returns: static path of the file
+    """
+    path = builddir / f"{stem}.tmp"
+    image.save(path, fmt, **options)
+    digest = hashlib.sha1(path.read_bytes()).hexdigest()[:12]
+    final = builddir / f"{stem}.{digest}.{fmt.lower()}"
+    path.replace(final)
+    return f"sandwiches/build/{final.name}"
+
+
+def layer(ingredient):
+    """Ingredient image cropped and resized to a sandwich layer"""
+    with Image.open(imgdir / f"{image_name(ingredient)}.jpg") as img:
+        return ImageOps.fit(img.convert("RGB"), TILE, Image.LANCZOS)
+
+
+def build_sandwiches():
+    """Builds the sprite sheets and manifest"""
+    builddir.mkdir(exist_ok=True)
+    for old in builddir.iterdir():
+        old.unlink()
+
+    names = [item for items in INGREDIENTS.values() for item in items]
+    width, height = TILE
+    sprite = Image.new("RGB", (width, height * len(names)))
+    images = {}
+    for i, name in enumerate(names):
+        tile = layer(name)
+        sprite.paste(layer(name), (0, i * height))
+        images[name] = dict(y=i * height)
+
+    manifest = dict(
+        tile=TILE,
+        sprite=save_hashed(sprite, "sprite", "WEBP", quality=80),
+        fallback=save_hashed(sprite, "sprite", "JPEG", quality=85, optimize=True, progressive=True),
+        height=sprite.height,
+        images=images,
+    )
+    with open(manifestfile, "w") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+def build_global():
+    """Writes WebP/AVIF variants of the global JPEGs next to them"""
+    for path in sorted(globaldir.glob("*.jpg")):
+        with Image.open(path) as img:
+            img = img.convert("RGB")
+            img.save(path.with_suffix(".webp"), "WEBP", quality=80)
+            img.save(path.with_suffix(".avif"), "AVIF", quality=60)
+
+
+if __name__ == "__main__":
+    manifest = build_sandwiches()
+    build_global()
+    print(f"{len(manifest['images'])} layers, sprite {manifest['sprite']}")
+    print("rebuild the menu bundle: python -m BaseExperiment.bundle")
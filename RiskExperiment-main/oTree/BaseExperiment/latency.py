@@ -0,0 +1,121 @@
+"""Latency histograms of the live methods
+
+Every live message is timed and counted into a histogram per page and message kind.
+Set LIVE_LATENCY_FILE to a path ending in .prom (Prometheus text format) or .csv
+to have the histograms written there whenever a player leaves a live page and at exit.
+"""
+import atexit
+import bisect
+import functools
+import os
+import threading
+import time
+
+# upper bounds of histogram buckets, in seconds
+BUCKETS = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0)
+
+
+class Histograms:
+    """Latency histograms keyed by (page, kind)"""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def observe(self, page, kind, seconds):
+        idx = bisect.bisect_left(self.buckets, seconds)
+        with self.lock:
+            hist = self.data.get((page, kind))
+            if hist is None:
+                # counts per bucket (last one is +Inf), total seconds
+                hist = self.data[(page, kind)] = [[0] * (len(self.buckets) + 1), 0.0]
+            hist[0][idx] += 1
+            hist[1] += seconds
+
+    def rows(self):
+        """Yields: page, kind, cumulative counts per bucket, total seconds"""
+        with self.lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self.data.items())
+        for (page, kind), (counts, total) in items:
+            cumulative = []
+            running = 0
+            for count in counts:
+                running += count
+                cumulative.append(running)
+            yield page, kind, cumulative, total
+
+    def prometheus(self, name="live_latency_seconds"):
+        lines = [
+            f"# HELP {name} Latency of live messages by page and kind.",
+            f"# TYPE {name} histogram",
+        ]
+        bounds = [str(b) for b in self.buckets] + ["+Inf"]
+        for page, kind, cumulative, total in self.rows():
+            labels = f'page="{page}",kind="{kind}"'
+            for le, count in zip(bounds, cumulative):
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {total}")
+            lines.append(f"{name}_count{{{labels}}} {cumulative[-1]}")
+        return "\n".join(lines) + "\n"
+
+    def csv(self):
+        header = ["page", "kind", "count", "sum"] + [f"le_{b}" for b in self.buckets]
+        lines = [",".join(header)]
+        for page, kind, cumulative, total in self.rows():
+            row = [page, kind, str(cumulative[-1]), f"{total:.6f}"] + [str(c) for c in cumulative[:-1]]
+            lines.append(",".join(row))
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Writes histograms in the format given by the file suffix"""
+        text = self.csv() if str(path).endswith(".csv") else self.prometheus()
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+
+LATENCY = Histograms()
+
+latencyfile = os.environ.get("LIVE_LATENCY_FILE")
+
+
+def dump():
+    """Writes histograms to LIVE_LATENCY_FILE, if configured"""
+    if latencyfile:
+        LATENCY.write(latencyfile)
+
+
+atexit.register(dump)
+
+
+def message_kind(message, reply):
+    """Classifies a handled message as start, valid/invalid sandwich, stale client or batch"""
+    if isinstance(message, list):
+        return "batch"
+    replies = next(iter(reply.values()))
+    first = replies[0] if isinstance(replies, list) else replies
+    if first['type'] == 'reload':
+        return "stale client"
+    kind = message.get('type')
+    if kind == 'sandwich':
+        return "sandwich invalid" if first['type'] == 'error' else "sandwich valid"
+    return str(kind)
+
+
+def timed(page):
+    """Wraps a player live method, recording its latency under page"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(player, message):
+            started = time.perf_counter()
+            try:
+                reply = method(player, message)
+            except Exception:
+                LATENCY.observe(page, "failed", time.perf_counter() - started)
+                raise
+            LATENCY.observe(page, message_kind(message, reply), time.perf_counter() - started)
+            return reply
+        return wrapper
+    return decorate
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from BaseExperiment.export import export, FORMATS
+
+
+class Command(BaseCommand):
+    help = "Streams the BaseExperiment player table, with group conditions, to CSV, Parquet or Arrow"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=FORMATS, help="default: from the file extension, else csv")
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, path, format=None, chunk_size=2000, **options):
+        fmt = format or path.rpartition('.')[2]
+        if fmt not in FORMATS:
+            fmt = 'csv'
+        try:
+            count = export(path, fmt, chunk_size)
+        except ImportError as e:
+            raise CommandError(str(e))
+        self.stdout.write(f"{count} players written to {path} ({fmt})")
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from BaseExperiment import replay
+from BaseExperiment.latency import LATENCY
+from BaseExperiment.models import Constants, Player
+from BaseExperiment.recipes import WIRE_VERSION
+
+
+class Command(BaseCommand):
+    help = "Replays the live messages of a session event log into a new session"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="events-<session code>.jsonl of the recorded session")
+        parser.add_argument('--config', default='BasicExperiment', help="session config of the new session")
+        parser.add_argument('--speed', type=float, default=1.0, help="1: recorded pace, 10: ten times faster, 0: no waiting")
+
+    def handle(self, path, config='BasicExperiment', speed=1.0, **options):
+        from otree.session import create_session
+
+        seed, messages = replay.load(path)
+        if not messages:
+            raise CommandError(f"no live messages recorded in {path}")
+        if seed is None:
+            raise CommandError(f"no order seed recorded in {path}, replayed orders would not match")
+        version = replay.wire_version(messages)
+        if version != WIRE_VERSION:
+            raise CommandError(
+                f"{path} was recorded with menu version {version}, this build has {WIRE_VERSION};"
+                " replay it from a checkout of the menu it was recorded with"
+            )
+
+        slots = max(slot for _, slot, _, _ in messages)
+        group_size = Constants.players_per_group
+        session = create_session(
+            config, num_participants=-(-slots // group_size) * group_size,
+            modified_session_config_fields=dict(order_seed=seed),
+        )
+        players = {
+            player.id_in_subsession: player.pk
+            for player in Player.objects.filter(session=session)
+        }
+        # live method each slot is on, to leave its page when the next one starts
+        pages = {}
+
+        def leave(slot):
+            player = Player.objects.get(pk=players[slot])
+            player.subsession.leave(player)
+            if pages[slot] == 'handle_practice':
+                player.reset_after_practice()
+            player.save()
+
+        def send(slot, method, message):
+            if pages.get(slot, method) != method:
+                leave(slot)
+            pages[slot] = method
+            # loaded and saved per message, as by the live consumer
+            player = Player.objects.get(pk=players[slot])
+            getattr(player, method)(message)
+            player.save()
+
+        seconds, behind = replay.replay(messages, send, speed)
+        for slot in pages:
+            leave(slot)
+
+        self.stdout.write(LATENCY.csv())
+        self.stdout.write(
+            f"{len(messages)} messages of {len(pages)} players replayed into session {session.code}"
+            f" in {seconds:.1f}s (speed {speed or 'unthrottled'}, at most {behind * 1000:.0f} ms behind schedule)"
+        )
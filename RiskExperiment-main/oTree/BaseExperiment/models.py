@@ -1,6 +1,5 @@
 import random
-import itertools
-import otreeutils
+from decimal import Decimal
 from otree.api import (
     models,
     widgets,
@@ -10,10 +9,19 @@ from otree.api import (
     BasePlayer,
     ExtraModel,
     Currency,
-    currency_range,
 )
 
-from .recipes import RECIPES
+from .recipes import (
+    MENU, NAMES, MASKS, ORDER_IDS, WIRE_VERSION,
+    sandwich_mask, popcount, order_stream, pack_stream, unpack_stream,
+)
+from .cache import GameCache, Metrics
+from .questionnaire import ITEMS, choices, fields
+from . import latency
+from .events import EVENTS, session_code
+from .writer import WRITER
+from .replay import recorded
+from . import startup
 
 author = 'Dieter Smeulders'
 
@@ -31,6 +39,23 @@ class Constants(BaseConstants):
     #    SellingPrice = Currency(1)
     EmployeeRatio = 0.5
     ManagerRatio = 0.25
+    # length of pre-generated order streams: one order per second of the longest round
+    max_orders = 300
+
+
+# revenue shares of shop manager, supervisor and firm
+SHARES = {'ownshare': Decimal('0.5'), 'supervisorshare': Decimal('0.25'), 'firmshare': Decimal('0.25')}
+# part of the round revenue kept when the risk materialized
+RISK_KEPT = Decimal('0.7')
+
+
+def shares(revenue, revenueR1, riskmaterialized):
+    """Revenue shares, in exact decimal arithmetic
+    Returns: share field -> Currency
+    """
+    revenue = Decimal(revenue) * (RISK_KEPT if riskmaterialized else 1)
+    revenueR1 = Decimal(revenueR1)
+    return {field: Currency(revenue * ratio + revenueR1 * ratio) for field, ratio in SHARES.items()}
 
 
 class GameSession(ExtraModel):
@@ -42,37 +67,93 @@ class GameSession(ExtraModel):
     player = models.Link('Player')
     ordered = models.StringField()
     price = models.CurrencyField()
+    # pre-generated orders (packed indices into MENU) and position in them
+    orders = models.LongStringField()
+    cursor = models.IntegerField(initial=0)
+
+    # a write of the current order is queued and not started yet, see Subsession.persist_game
+    _queued = False
+    # field -> value of the current order, taken together by the request queueing its write
+    _written = None
 
     def next_order(self, price):
-        """Generates and saves next random order"""
-        self.ordered = random.choice(list(RECIPES.keys()))
+        """Advances to next order of the pre-generated stream"""
+        stream = self.stream()
+        self.ordered = MENU[stream[self.cursor % len(stream)]]
+        self.cursor += 1
         self.price = price
 
+    def stream(self):
+        """Unpacked orders, decoded once per game object"""
+        try:
+            return self._stream
+        except AttributeError:
+            self._stream = unpack_stream(self.orders)
+            return self._stream
+
+    def persist(self):
+        """Writes the order last taken by Subsession.persist_game
+        Run by the writer, it clears the queued mark before reading the order,
+        so that an order taken meanwhile is queued again.
+        """
+        self._queued = False
+        GameSession.objects.filter(pk=self.pk).update(**self._written)
+
     def validate(self, sandwich):
-        """Validates if submitted sandwich matches ordered
+        """Validates if submitted sandwich (list of ingredient ids) matches ordered
         Returns: valid, reward, errors
         """
-        expected = RECIPES[self.ordered]
-        mismatches = len(set(sandwich) ^ set(expected))
+        # unknown ingredients are never part of the recipe, each counts as a mismatch
+        mask, unknown = sandwich_mask(sandwich, len(NAMES))
+        mismatches = popcount(MASKS[self.ordered] ^ mask) + unknown
         if mismatches == 0:
             return True, self.price, 0
         else:
             return False, 0, mismatches
 
 
+# live games and metrics of players on the shop pages, kept per worker process
+GAMES = GameCache()
+METRICS = GameCache()
+# seconds without a live message after which the state of a player is dropped,
+# as players closing the page never reach Subsession.leave
+IDLE_TTL = 30 * 60
+# seconds between runs of sweep
+SWEEP_PERIOD = 1.0
+
+
 class Subsession(BaseSubsession):
 
     def creating_session(self):
         reportingconditions = ['voluntary', 'mandatory']
         cultureconditions = ['supportive', 'supportive', 'unsupportive', 'unsupportive']
-        for group in self.get_groups():
-            group.reportingcondition = random.choice(reportingconditions)
-            print(group.reportingcondition)
-            group.culturecondition = random.choice(cultureconditions)
-            print(group.culturecondition)
-        for player in self.get_players():
-            self.configure_player(player)
-            GameSession.objects.create(player=player)
+        groups = self.get_groups()
+        reporting = random.choices(reportingconditions, k=len(groups))
+        culture = random.choices(cultureconditions, k=len(groups))
+        for group, reportingcondition, culturecondition in zip(groups, reporting, culture):
+            group.reportingcondition = reportingcondition
+            group.culturecondition = culturecondition
+            EVENTS.emit(self.session.code, 'group', group=group.id_in_subsession,
+                        reporting=reportingcondition, culture=culturecondition)
+
+        players = self.get_players()
+        self.configure_players(players)
+        seed = self.order_seed()
+        EVENTS.emit(self.session.code, 'session', order_seed=seed)
+        GameSession.objects.bulk_create([
+            GameSession(player=player, orders=pack_stream(
+                order_stream(f"{seed}:{player.id_in_subsession}", Constants.max_orders, MENU)))
+            for player in players
+        ])
+
+    def order_seed(self):
+        """Seed of order streams, from session config or drawn once per session"""
+        if 'order_seed' not in self.session.vars:
+            seed = self.session.config.get('order_seed')
+            if seed is None:
+                seed = random.randrange(2 ** 32)
+            self.session.vars['order_seed'] = seed
+        return self.session.vars['order_seed']
 
     #    MandatoryCondition = models.IntegerField(initial=1)
     #    CultureCondition = models.IntegerField(initial=1)
@@ -80,54 +161,137 @@ class Subsession(BaseSubsession):
     # setting gamesession variables
 
     # Game Related Logic
-    def configure_player(self, player):
-        p = player.id_in_group
-
-        duration_min = self.session.config[f"P{p}_duration_min"]
-        duration_max = self.session.config[f"P{p}_duration_max"]
-        player.duration = random.randint(duration_min, duration_max)
-
-        price_min = self.session.config[f"P{p}_price_min"]
-        price_max = self.session.config[f"P{p}_price_max"]
-        player.price = Currency(random.randint(price_min, price_max))
+    def configure_players(self, players):
+        """Draws duration and price of all players, using ranges of their role,
+        and stores the role in participant.vars for page routing
+        """
+        config = self.session.config
+        ranges = {}
+        for player in players:
+            p = player.id_in_group
+            if p not in ranges:
+                ranges[p] = (
+                    config[f"P{p}_duration_min"], config[f"P{p}_duration_max"],
+                    config[f"P{p}_price_min"], config[f"P{p}_price_max"],
+                )
+            duration_min, duration_max, price_min, price_max = ranges[p]
+            player.duration = random.randint(duration_min, duration_max)
+            player.price = Currency(random.randint(price_min, price_max))
+            player.participant.vars['role'] = p
 
     def game(self, player):
-        return GameSession.objects.get(player=player)
+        """Returns game of the player, from memory or from database"""
+        return GAMES.get(player.id, lambda: GameSession.objects.get(player=player))
+
+    def metrics(self, player):
+        """Returns in-memory metrics of the player"""
+        return METRICS.get(player.id, lambda: Metrics(
+            player, self.session.config['flush_every'], self.session.config['flush_interval']))
+
+    def leave(self, player):
+        """Writes pending metrics to a player leaving the live page
+        and forgets the in-memory state.
+        Waits for the queued writes of the player; the player is saved by the page.
+        If some of them failed, the current order is written again here,
+        raising if the database still fails.
+        """
+        metrics = METRICS.evict(player.id)
+        if metrics is not None:
+            with metrics.lock:
+                metrics.flush(player)
+        failed = WRITER.wait(player.id)
+        game = GAMES.evict(player.id)
+        if failed and game is not None and game._written is not None:
+            game.persist()
+        latency.dump()
 
     def start(self, player):
         game = self.game(player)
         game.next_order(player.price)
-        game.save()
+        self.persist_game(player, game)
+        self.metrics(player).issued()
+        self.log_order(player, game)
         return game
 
     def play(self, player, sandwich):
         """Main gameplay logic:
         - validating submitted sandwich
-        - updating metrics
+        - updating metrics (written behind, see Metrics)
         - advancing to next order
+        Writes are queued (see writer.py), the reply does not wait for the database.
         """
         game = self.game(player)
+        metrics = self.metrics(player)
         valid, reward, errors = game.validate(sandwich)
-
-        if valid:
-            player.performed += 1
-            player.revenue += reward
-        else:
-            player.errors += 1
-            player.mismatches = max(player.mismatches, errors)
-        player.save()
+        EVENTS.emit(session_code(player), 'submission', player=player.id, order=game.ordered,
+                    components=sandwich, valid=valid, mismatches=errors)
+
+        with metrics.lock:
+            if valid:
+                metrics.performed += 1
+                metrics.revenue += reward
+                metrics.completed()
+            else:
+                metrics.errors += 1
+                metrics.attempts += 1
+                metrics.mismatches = max(metrics.mismatches, errors)
+            metrics.pending += 1
+            values = metrics.snapshot() if metrics.due() else None
+        if values is not None:
+            write_metrics(player.id, values)
 
         if valid:
             game.next_order(player.price)
-            game.save()
+            self.persist_game(player, game)
+            metrics.issued()
+            self.log_order(player, game)
 
         return game, valid, errors
 
+    def persist_game(self, player, game):
+        """Queues a write of the current order of the game, unless one is queued and not started yet
+        The order is taken here, on the request thread, as next_order may change it while the write runs.
+        """
+        game._written = dict(ordered=game.ordered, cursor=game.cursor, price=game.price)
+        if not game._queued:
+            game._queued = True
+            WRITER.submit(player.id, game.persist)
+
+    def log_order(self, player, game):
+        EVENTS.emit(session_code(player), 'order', player=player.id, order=game.ordered, cursor=game.cursor)
+
 
 class Group(BaseGroup):
     reportingcondition = models.StringField()
     culturecondition = models.StringField()
 
+    def roster(self):
+        """Players of the group by id_in_group, loaded with one query
+
+        Memoized on the group instance, which oTree loads per request,
+        so the roster is dropped when the request ends.
+        """
+        roster = self.__dict__.get('_roster')
+        if roster is None:
+            roster = self._roster = {player.id_in_group: player for player in self.get_players()}
+        return roster
+
+    def member(self, role):
+        """Returns the player of the group in role (MANAGER or SUPERVISOR)"""
+        return self.roster()[role]
+
+
+def questionnaire_fields(names):
+    """Player fields of the named questionnaire items"""
+    return {
+        name: models.IntegerField(
+            label=ITEMS[name].label,
+            choices=choices(ITEMS[name].anchors),
+            widget=widgets.RadioSelectHorizontal
+        )
+        for name in names
+    }
+
 
 class Player(BasePlayer):
     name = models.StringField
@@ -136,11 +300,16 @@ class Player(BasePlayer):
     # All Parameters for the sandwich making task
     """A player parameters and metrics
 
-        Implements communication logic:
+        Implements communication logic.
+        Orders and ingredients travel as ids (positions in MENU and NAMES),
+        every message carries the WIRE_VERSION the client was rendered with.
 
         received 'start':
         - send order
 
+        received a list of messages:
+        - handle each of them and send all replies in one list
+
         received 'sandwich':
         - validate sandwich
 
@@ -165,6 +334,8 @@ class Player(BasePlayer):
     errors = models.IntegerField(initial=0)
     # maximal number of mismatched components
     mismatches = models.IntegerField(initial=0)
+    # completion time and failed attempts of each order, packed (see timings.py)
+    ordertimes = models.LongStringField(initial='')
     # time allocated
     time = models.IntegerField(initial=5)
     # first round performance
@@ -181,6 +352,11 @@ class Player(BasePlayer):
     firmshare = models.CurrencyField()
 
     def handle_message(self, message):
+        if isinstance(message, list):
+            return self.reply(self.handle_batch(message))
+        if message.get('v') != WIRE_VERSION:
+            # page rendered with an older menu: the client reloads it
+            return self.reply(self.reload_message())
         kind = message['type']
         if kind == 'start':
             return self.handle_start()
@@ -189,6 +365,23 @@ class Player(BasePlayer):
         else:
             raise ValueError("Invalid message received", kind)
 
+    # live methods of the shop pages, recorded for replay and timed per page and message kind
+    handle_practice = latency.timed('M3Shop')(recorded('handle_practice')(handle_message))
+    handle_round1 = latency.timed('M12Round1')(recorded('handle_round1')(handle_message))
+
+    def handle_batch(self, messages):
+        """Handles several messages received in one frame
+        Returns: combined list of replies, in order
+        """
+        replies = []
+        for message in messages:
+            reply = self.handle_message(message)[self.id_in_group]
+            if isinstance(reply, list):
+                replies.extend(reply)
+            else:
+                replies.append(reply)
+        return replies
+
     def handle_start(self):
         game = self.subsession.start(self)
         return self.reply(self.order_message(game))
@@ -204,34 +397,28 @@ class Player(BasePlayer):
         return {self.id_in_group: message}
 
     def order_message(self, game):
-        return {'type': 'order', 'order': game.ordered}
+        return {'type': 'order', 'order': ORDER_IDS[game.ordered]}
+
+    def reload_message(self):
+        return {'type': 'reload'}
 
     def errors_message(self, errors):
         return {'type': 'error', 'mismatches': errors}
 
     def status_message(self):
-        return {'type': 'status', 'performed': self.performed}
+        return {'type': 'status', 'performed': self.subsession.metrics(self).performed}
+
+    def set_shares(self):
+        """Sets the revenue shares of the player, from its own revenue"""
+        for field, value in shares(self.revenue, self.revenueR1, self.riskmaterialized).items():
+            setattr(self, field, value)
 
     def reset_after_practice(self):
         self.performed = 0
         self.revenue = 0
         self.errors = 0
         self.mismatches = 0
-
-    def calcrevenue(self):
-        if self.riskmaterialized == 1:
-            self.ownshare = self.revenue * 0.5 * 0.7 + self.revenueR1 * 0.5
-            self.supervisorshare = self.revenue * 0.25 * 0.7 + self.revenueR1 * 0.25
-            self.firmshare = self.revenue * 0.25 * 0.7 + self.revenueR1 * 0.25
-        else:
-            self.ownshare = self.revenue * 0.5 + self.revenueR1 * 0.5
-            self.firmshare = self.revenue * 0.25 + self.revenueR1 * 0.25
-            if (self.id_in_group == 1 and self.group.get_player_by_id(3).NEM):
-                self.supervisorshare = self.revenue * 0.25 + self.revenueR1 * 0.25 - 0.1
-            if (self.id_in_group == 2 and self.group.get_player_by_id(3).SEM):
-                self.supervisorshare = self.revenue * 0.25 + self.revenueR1 * 0.25 - 0.1
-            else:
-                self.supervisorshare = self.revenue * 0.25 + self.revenueR1 * 0.25
+        self.ordertimes = ''
 
     # All other parameters
     report_displayed = models.BooleanField(initial=False)
@@ -312,381 +499,11 @@ class Player(BasePlayer):
         widget=widgets.RadioSelectHorizontal
     )
 
-    # PostQuestionnaire
+    # PostQuestionnaire, declared in questionnaire.py and added to the class below.
+    # The fields are created here, as Django orders fields (and export columns) by creation.
+
+    _questionnaire = questionnaire_fields([name for name in ITEMS if name not in fields('gen')])
 
-    closure1 = models.IntegerField(
-        label='I did not disclose all relevant risk information to the supervisor.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure2 = models.IntegerField(
-        label='I did not devote much effort to reporting risks to the supervisor.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure3 = models.IntegerField(
-        label='I honestly reported all the risk information that I had to the supervisor.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure4 = models.IntegerField(
-        label='I reported the risk information that I had to the supervisor as objectively as possible.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure5 = models.IntegerField(
-        label='I felt that my risk report was quite informative.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure6 = models.IntegerField(
-        label='I did not give an accurate account of the risks that I faced to the supervisor.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure7 = models.IntegerField(
-        label='I withheld some unfavorable information from the supervisor.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure8 = models.IntegerField(
-        label='I focused on favorable information more than unfavorable information in my risk report.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure9 = models.IntegerField(
-        label='I tried to cover up some unfavorable news by emphasizing the favorable information.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure10 = models.IntegerField(
-        label='I did not include information that had negative implications for my performance evaluation.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure11 = models.IntegerField(
-        label='I felt responsible to inform the supervisor about the risks I was exposed to.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    closure12 = models.IntegerField(
-        label='It was my responsibility to provide the supervisor with '
-              'the detailed information about the potential risks which I faced.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    S1 = models.IntegerField(
-        label='How informative the risk report of the shop manager was?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    S2 = models.IntegerField(
-        label='To what extent do you think the shop manager provided all relevant risk information to you?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    S3 = models.IntegerField(
-        label='How detailed the risk report of the shop manager was?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    S4 = models.IntegerField(
-        label='How useful did you find the risk report of the shop manager for the risk management purposes? ',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    S5 = models.IntegerField(
-        label='How accurate did you find the risk report of the shop manager?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    S6 = models.IntegerField(
-        label='How severe did you find the potential risks to the shop given the report of the shop manager?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    importance1 = models.IntegerField(
-        label='...placed importance on risk management?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    importance2 = models.IntegerField(
-        label='...placed emphasis on the timely communication of risk information?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    importance3 = models.IntegerField(
-        label='...placed value on open sharing of risk information?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    importance4 = models.IntegerField(
-        label='...facilitated communication of risk information?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    image1 = models.IntegerField(
-        label='...the superior would have a negative image of me',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    image2 = models.IntegerField(
-        label='...my image in the eyes of the supervisor would be improved',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    image3 = models.IntegerField(
-        label='...I would look bad in the eyes of the supervisor',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    image4 = models.IntegerField(
-        label='...the supervisor would think better of me',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    image5 = models.IntegerField(
-        label='...the supervisor would think worse of me',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    image6 = models.IntegerField(
-        label='...the supervisor would appreciate it',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    image7 = models.IntegerField(
-        label='...the supervisor would penalize me',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    factor1 = models.IntegerField(
-        label='..report the risks that you faced to the supervisor?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    factor2 = models.IntegerField(
-        label='..show the supervisor that you made the right location choice?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    factor3 = models.IntegerField(
-        label='..report risks in such a way that could have positively impact your performance evaluation?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    factor4 = models.IntegerField(
-        label='..look good in the eyes of the supervisor?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    factor5 = models.IntegerField(
-        label='..look competent in the eyes of the supervisor?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    factor6 = models.IntegerField(
-        label='..avoid creating a negative impression on the supervisor?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    factor7 = models.IntegerField(
-        label='..be honest in your report?',
-        choices=[[1, 'Little'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very much']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    trust1 = models.IntegerField(
-        label='I felt that the company trusts me to report risks.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    trust2 = models.IntegerField(
-        label='The firm risk reporting policy showed that the firm does not trust its employees.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    trust3 = models.IntegerField(
-        label='The firm risk reporting policy was a clear sign of distrust in employees.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    oblig1 = models.IntegerField(
-        label='I felt obliged to disclose the risk information that I had to the supervisor.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    oblig2 = models.IntegerField(
-        label='I felt that I can easily share the risks to my sales revenue to the supervisor.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    oblig3 = models.IntegerField(
-        label='I felt that I can openly share unfavorable risk information with the supervisor without being punished.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    oblig4 = models.IntegerField(
-        label='I felt that the risks I faced were because of the decision that I had taken. ',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    oblig5 = models.IntegerField(
-        label='I felt that I should manage the risks that I faced on my own. ',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    oblig6 = models.IntegerField(
-        label='I felt that the risks were not so severe for the company. ',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    oblig7 = models.IntegerField(
-        label='I felt that the potential impacts of a new competitor on the sales performance is serious.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    perf1 = models.IntegerField(
-        label='',
-        choices=[[1, 'Way below the average'], [2, ''], [3, 'Average'], [4, ''], [5, 'Way above the average']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    perf2 = models.IntegerField(
-        label='',
-        choices=[[1, 'Way below my expectation'], [2, ''], [3, 'In line with my expectation'], [4, ''],
-                 [5, 'Way above my expectation']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    safety1 = models.IntegerField(
-        label='If you make a mistake in this company, it is often held against you.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    safety2 = models.IntegerField(
-        label='Members of this company are able to bring up problems and tough issues.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    safety3 = models.IntegerField(
-        label='People in this organization sometimes reject others for being different.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    safety4 = models.IntegerField(
-        label='It is safe to take risks in this company.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    safety5 = models.IntegerField(
-        label='It is difficult to ask other members of this company for help.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    safety6 = models.IntegerField(
-        label='No one in this company would deliberately act in a way that undermines my efforts.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    safety7 = models.IntegerField(
-        label='Working with members of this company, my unique skills and talents are valued and utilized.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    manvol1 = models.IntegerField(
-        label='The company requires its managers to report to their supervisors the risks they are exposed to.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    manvol2 = models.IntegerField(
-        label='In this company, it is compulsory for managers to report the risks they face to the superior in their '
-              'performance reports.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    manvol3 = models.IntegerField(
-        label='In this company, managers are mandated to disclose the risks they face.',
-        choices=[[1, 'Very inaccurate'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Very accurate']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    reason1 = models.IntegerField(
-        label='To encourage honesty and trust.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    reason2 = models.IntegerField(
-        label='To facilitate timely communication of risk information.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    reason3 = models.IntegerField(
-        label='To collect important risk information and manage them at the firm level.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    reason4 = models.IntegerField(
-        label='To fit the culture of the company.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    reason5 = models.IntegerField(
-        label='To evaluate the decisions of the managers.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    riskat1 = models.IntegerField(
-        label='I can be rather incautious and take big risks.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    riskat2 = models.IntegerField(
-        label='I often dare to do risky things which other people are reluctant to do.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    riskat3 = models.IntegerField(
-        label='I am always very cautious and think of safety first.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    riskat4 = models.IntegerField(
-        label='I always try to avoid situations involving a risk of getting into trouble with other people.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    riskat5 = models.IntegerField(
-        label='I like to avoid doing things for which I run the risk of being criticized and blamed if I fail.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    opt1 = models.IntegerField(
-        label='In uncertain times, I usually expect the best.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    opt2 = models.IntegerField(
-        label='I rarely count on good things happening to me.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    opt3 = models.IntegerField(
-        label='Overall, I expect more good things to happen to me than bad.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    unc1 = models.IntegerField(
-        label='Unforeseen events upset me greatly.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    unc2 = models.IntegerField(
-        label='It frustrates me not having all information I need.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    unc3 = models.IntegerField(
-        label='I cannot stand being taken by surprises.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, ''], [6, ''], [7, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
     gender = models.IntegerField(
         label='What is your gender?',
         choices=[[1, 'Male'], [2, 'Female'], [3, 'Other']],
@@ -698,27 +515,46 @@ class Player(BasePlayer):
     WorkExperience = models.IntegerField(
         label='How many months of work experience do you have?',
         min=0, max=100)
-    gen1 = models.IntegerField(
-        label='My task was boring.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    gen2 = models.IntegerField(
-        label='May task was difficult.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    gen3 = models.IntegerField(
-        label='I enjoyed participating in this study.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
-    gen4 = models.IntegerField(
-        label='The instructions were clearly formulated.',
-        choices=[[1, 'Strongly disagree'], [2, ''], [3, ''], [4, ''], [5, 'Strongly agree']],
-        widget=widgets.RadioSelectHorizontal
-    )
+
+    _general = questionnaire_fields(fields('gen'))
+
     comment = models.LongStringField(
         label='Please share your comments about this study here.',
         blank = True
     )
+
+
+for name, field in {**Player._questionnaire, **Player._general}.items():
+    Player.add_to_class(name, field)
+del Player._questionnaire, Player._general
+
+
+def write_metrics(pk, values):
+    """Queues a write of a snapshot of the metrics of player pk
+    The player itself is left unchanged, or oTree would also save the values at the end of the request;
+    they are copied to it by Subsession.leave.
+    """
+    WRITER.submit(pk, lambda: Player.objects.filter(pk=pk).update(**values))
+
+
+def sweep():
+    """Writes metrics pending for their flush_interval, and drops the state of players idle for IDLE_TTL
+    Run by the writer thread (see Writer.schedule), so a player sending no more messages,
+    or gone without leaving the page, still has the metrics of all submissions written.
+    """
+    idle = set(METRICS.idle(IDLE_TTL))
+    for pk, metrics in METRICS.items():
+        with metrics.lock:
+            values = metrics.snapshot() if metrics.overdue() or pk in idle and metrics.pending else None
+        if values is not None:
+            write_metrics(pk, values)
+    for pk in idle:
+        METRICS.evict(pk)
+    for pk in GAMES.idle(IDLE_TTL):
+        GAMES.evict(pk)
+
+
+WRITER.schedule(sweep, SWEEP_PERIOD)
+
+
+startup.mark('models')
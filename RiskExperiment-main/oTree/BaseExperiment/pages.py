@@ -1,11 +1,32 @@
-from django.shortcuts import render
-
 # from otree.api import Currency as c, currency_range
 from ._builtin import Page, WaitPage
 from .models import Constants
-from .recipes import RECIPES, INGREDIENTS, images_map
+from .recipes import INGREDIENTS, MENU, SPRITE, WIRE_VERSION
+from .bundle import BUNDLE
+from .questionnaire import PAGES, MANAGER, SUPERVISOR
+from . import startup
+
+
+class Routed:
+    """Pages of one role set role to MANAGER or SUPERVISOR, pages of both roles leave it None
+
+    The pages of each role are resolved once into ROUTES, so is_displayed is a lookup
+    of the participant's role, stored at session creation, without loading the player.
+    """
+    role = None
+
+    def is_displayed(self):
+        role = self.participant.vars.get('role') or self.player.id_in_group
+        return type(self) in DISPLAYED[role]
+
+
+class RolePage(Routed, Page):
+    pass
+
+
+class RoleWaitPage(Routed, WaitPage):
+    pass
 
-IMAGES = images_map(INGREDIENTS)
 
 class _PreStartIntro(Page):
     pass
@@ -22,64 +43,59 @@ class M2IntroPage2(Page):
 class M3PlayerIntroPage(Page):
     pass
 
-class M3Shop(Page):
-    live_method = "handle_message"
+class M3Shop(RolePage):
+    role = MANAGER
+    live_method = "handle_practice"
 
     def vars_for_template(self):
-        return dict(ingredients=INGREDIENTS, menu=RECIPES)
+        # load the game into memory before the live messages arrive
+        self.subsession.game(self.player)
+        return dict(ingredients=INGREDIENTS, menu=MENU, bundle=BUNDLE, sprite=SPRITE)
 
     def js_vars(self):
-        return dict(duration=120, menu=RECIPES, images=IMAGES)
+        return dict(duration=120, version=WIRE_VERSION)
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+    def before_next_page(self):
+        self.subsession.leave(self.player)
 
 
-class M4LocationChoice1(Page):
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+class M4LocationChoice1(RolePage):
+    role = MANAGER
 
 
-class M4LocationChoice2(Page):
+class M4LocationChoice2(RolePage):
+    role = MANAGER
     form_model = 'player'
 
     def get_form_fields(self):
         return ['NLocationChoice']
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
 
+class M5LocationApproval(RolePage):
+    role = MANAGER
 
-class M5LocationApproval(Page):
-    def is_displayed(self):
-        return self.player.id_in_group == 1
 
+class N1SPLocation(RolePage):
+    role = SUPERVISOR
 
-class N1SPLocation(Page):
     def vars_for_template(self):
-        return dict(northernlocation=self.group.get_player_by_id(1).NLocationChoice)
+        return dict(northernlocation=self.group.member(MANAGER).NLocationChoice)
 
-    def is_displayed(self):
-        return self.player.id_in_group == 2
-
-class WRAlloc(WaitPage):
+class WRAlloc(RoleWaitPage):
+    role = SUPERVISOR
     body_text = "The shop manager is getting familiar with her/his task, and is selecting a location for the new shop. Please wait. This may take up to 5 minutes."
 
-    def is_displayed(self):
-        return self.player.id_in_group == 2
-
 class M6CultureCondition(Page):
     pass
 
 class M7procedure(Page):
     pass
 
-class M10AfterPractice(Page):
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+class M10AfterPractice(RolePage):
+    role = MANAGER
 
     def vars_for_template(self):
-        return dict(BasePrice=Constants.BasePrice, BasePay=Constants.BasePay,northernlocation=self.group.get_player_by_id(1).NLocationChoice)
+        return dict(BasePrice=Constants.BasePrice, BasePay=Constants.BasePay,northernlocation=self.player.NLocationChoice)
 
     # Reset Game Values
     def before_next_page(self):
@@ -143,54 +159,53 @@ class M11ComprehensionSurvey2(Page):
             if value != 2:
                 return 'Please check your answer.'
 
-class M12Round1(Page):
-    live_method = "handle_message"
+class M12Round1(RolePage):
+    role = MANAGER
+    live_method = "handle_round1"
 
     def vars_for_template(self):
-        return dict(ingredients=INGREDIENTS, menu=RECIPES)
+        # load the game into memory before the live messages arrive
+        self.subsession.game(self.player)
+        return dict(ingredients=INGREDIENTS, menu=MENU, bundle=BUNDLE, sprite=SPRITE)
 
     def js_vars(self):
-        return dict(duration=300, menu=RECIPES, images=IMAGES)
+        return dict(duration=300, version=WIRE_VERSION)
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+    def before_next_page(self):
+        self.subsession.leave(self.player)
 
 
-class N4SPBefWait(Page):
-    def is_displayed(self):
-        return self.player.id_in_group == 2
+class N4SPBefWait(RolePage):
+    role = SUPERVISOR
 
-class AfterRound1Game(Page):
+class AfterRound1Game(RolePage):
+    role = MANAGER
     timeout_seconds = 15
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
-
-class N5SPBefReporting(Page):
-    def is_displayed(self):
-        return self.player.id_in_group == 2
+class N5SPBefReporting(RolePage):
+    role = SUPERVISOR
 
 
-class M13AfterRound1Game(Page):
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+class M13AfterRound1Game(RolePage):
+    role = MANAGER
 
     def vars_for_template(self):
-        return dict(northernlocation=self.group.get_player_by_id(1).NLocationChoice)
+        return dict(northernlocation=self.player.NLocationChoice)
+
+class M14RiskEvent(RolePage):
+    role = MANAGER
 
-class M14RiskEvent(Page):
     def vars_for_template(self):
-        return dict(northernlocation=self.group.get_player_by_id(1).NLocationChoice)
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+        return dict(northernlocation=self.player.NLocationChoice)
 
 
-class M15ReportingScreen(Page):
+class M15ReportingScreen(RolePage):
+    role = MANAGER
     form_model = 'player'
 
     def vars_for_template(self):
         revenue = self.player.revenue
-        return dict(revenue=revenue,northernlocation=self.group.get_player_by_id(1).NLocationChoice)
+        return dict(revenue=revenue,northernlocation=self.player.NLocationChoice)
 
     def get_form_fields(self):
         if self.group.reportingcondition == 'mandatory':
@@ -198,160 +213,110 @@ class M15ReportingScreen(Page):
         else:
             return ['NReportedRiskVol']
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
-
-class AfterRound1Report(Page):
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+class AfterRound1Report(RolePage):
+    role = MANAGER
 
-class WReport(Page):
+class WReport(RolePage):
+    role = SUPERVISOR
 #    timer_text = 'The shop manager is making and selling sandwiches. Please Wait:'
 #    timeout_seconds = 360
     timeout_seconds = 90
 
-    def is_displayed(self):
-        return self.player.id_in_group == 2
-
-class WReport2(Page):
+class WReport2(RolePage):
+    role = SUPERVISOR
     timeout_seconds =  200
 
-    def is_displayed(self):
-        return self.player.id_in_group == 2
-
-class WReport3(WaitPage):
+class WReport3(RoleWaitPage):
+    role = SUPERVISOR
     template_name = 'global/RiskWaitPage.html'
 
-    def is_displayed(self):
-        return self.player.id_in_group == 2
-
 
-class M16PostExpQuest(Page):
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+class M16PostExpQuest(RolePage):
+    role = MANAGER
 
 
-class N6SPEvaluation(Page):
+class N6SPEvaluation(RolePage):
+    role = SUPERVISOR
     form_model = 'player'
     form_fields = ['Evaluation']
 
     def vars_for_template(self):
+        manager = self.group.member(MANAGER)
         return dict(
-            northernreportedperformance=self.group.get_player_by_id(1).revenue,
-            northernmandatoryrisk=self.group.get_player_by_id(1).NReportedRiskManD,
-            northernvoluntaryrisk=self.group.get_player_by_id(1).NReportedRiskVol
+            northernreportedperformance=manager.revenue,
+            northernmandatoryrisk=manager.NReportedRiskManD,
+            northernvoluntaryrisk=manager.NReportedRiskVol
         )
 
-    def is_displayed(self):
-        return self.player.id_in_group == 2
-
 
-class Post1Quality2temp (Page):
+class QuestionnairePage(RolePage):
+    """Page of questionnaire items; fields and role are taken from questionnaire.PAGES by class name"""
     form_model = 'player'
-    form_fields = ['S1', 'S2', 'S3', 'S4', 'S5', 'S6']
 
-    def is_displayed(self):
-        return self.player.id_in_group == 2
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__name__ in PAGES:
+            cls.form_fields, cls.role = PAGES[cls.__name__]
 
 
-class Post1Quality1(Page):
-    form_model = 'player'
-    form_fields = ['closure1', 'closure2', 'closure3', 'closure4', 'closure5', 'closure6']
-
-    def is_displayed(self):
-        return self.player.id_in_group == 1
-
-
-class Post1Quality2(Page):
-    form_model = 'player'
-    form_fields = ['closure7', 'closure8', 'closure9', 'closure10', 'closure11', 'closure12']
-
-    def is_displayed(self):
-        return self.player.id_in_group == 1
-
+class Post1Quality2temp(QuestionnairePage):
+    pass
 
-class N7SAssess(Page):
-    form_model = 'player'
-    form_fields = ['S1', 'S2', 'S3', 'S4', 'S5', 'S6']
 
-    def is_displayed(self):
-        return self.player.id_in_group == 2
+class Post1Quality1(QuestionnairePage):
+    pass
 
 
-class Post2importance(Page):
-    form_model = 'player'
-    form_fields = ['importance1', 'importance2', 'importance3', 'importance4']
-
+class Post1Quality2(QuestionnairePage):
+    pass
 
-class Post3image1(Page):
-    form_model = 'player'
-    form_fields = ['image1', 'image2', 'image3', 'image4', 'image5', 'image6', 'image7']
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+class N7SAssess(QuestionnairePage):
+    pass
 
 
-class Post4factor(Page):
-    form_model = 'player'
-    form_fields = ['factor1', 'factor2', 'factor3', 'factor4', 'factor5', 'factor6', 'factor7']
+class Post2importance(QuestionnairePage):
+    pass
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
 
+class Post3image1(QuestionnairePage):
+    pass
 
-class Post5trust(Page):
-    form_model = 'player'
-    form_fields = ['trust1', 'trust2', 'trust3']
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+class Post4factor(QuestionnairePage):
+    pass
 
 
-class Post6oblig(Page):
-    form_model = 'player'
-    form_fields = ['oblig1', 'oblig2', 'oblig3', 'oblig4', 'oblig5', 'oblig6', 'oblig7']
+class Post5trust(QuestionnairePage):
+    pass
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
 
+class Post6oblig(QuestionnairePage):
+    pass
 
-class Post7perf(Page):
-    form_model = 'player'
-    form_fields = ['perf1', 'perf2']
 
-    def is_displayed(self):
-        return self.player.id_in_group == 1
+class Post7perf(QuestionnairePage):
+    pass
 
 
-class Post8mansafetycheck(Page):
-    form_model = 'player'
-    form_fields = ['safety1', 'safety2', 'safety3', 'safety4', 'safety5', 'safety6', 'safety7']
+class Post8mansafetycheck(QuestionnairePage):
+    pass
 
 
-class Post9manvoluntarycheck(Page):
-    form_model = 'player'
-    form_fields = ['manvol1', 'manvol2', 'manvol3']
+class Post9manvoluntarycheck(QuestionnairePage):
+    pass
 
 
-class Post10volexp(Page):
-    form_model = 'player'
-    form_fields = ['reason1', 'reason2', 'reason3', 'reason4', 'reason5']
-#    form_fields = ['mandatory', 'voluntary']
-#    def get_form_fields(self):
-#        if self.group.reportingcondition == 'mandatory':
-#            return ['mandatory']
-#        else:
-#            return ['voluntary']
+class Post10volexp(QuestionnairePage):
+    pass
 
 
-class Post11riskattitude1(Page):
-    form_model = 'player'
-    form_fields = ['riskat1', 'riskat2', 'riskat3', 'riskat4', 'riskat5']
+class Post11riskattitude1(QuestionnairePage):
+    pass
 
 
-class Post12optimism(Page):
-    form_model = 'player'
-    form_fields = ['opt1', 'opt2', 'opt3', 'unc1', 'unc2', 'unc3']
+class Post12optimism(QuestionnairePage):
+    pass
 
 
 class Post14gender(Page):
@@ -359,15 +324,15 @@ class Post14gender(Page):
     form_fields = ['gender', 'age', 'WorkExperience']
 
 
-class Post15GenQuest(Page):
-    form_model = 'player'
-    form_fields = ['gen1', 'gen2', 'gen3', 'gen4', 'comment']
+class Post15GenQuest(QuestionnairePage):
+    def before_next_page(self):
+        self.player.set_shares()
 
 
 class Results(Page):
     def vars_for_template(self):
         Partcode = self.participant.code[:3]
-        return dict(Evaluation=self.group.get_player_by_id(2).get_Evaluation_display(), BasePay=Constants.BasePay,Code=Partcode)
+        return dict(Evaluation=self.group.member(SUPERVISOR).get_Evaluation_display(), BasePay=Constants.BasePay,Code=Partcode)
 
 
 page_sequence = [_PreStartIntro, _PrestartWait, M1IntroPage, M2IntroPage2, M3PlayerIntroPage, M3Shop, M4LocationChoice1,
@@ -379,3 +344,12 @@ page_sequence = [_PreStartIntro, _PrestartWait, M1IntroPage, M2IntroPage2, M3Pla
                  Post3image1, Post4factor, Post5trust, Post6oblig, Post7perf,
                  Post8mansafetycheck, Post9manvoluntarycheck, Post10volexp, Post11riskattitude1,
                  Post12optimism, Post14gender, Post15GenQuest, Results]
+
+# role -> pages shown to it, in order
+ROUTES = {
+    role: [page for page in page_sequence if getattr(page, 'role', None) in (None, role)]
+    for role in (MANAGER, SUPERVISOR)
+}
+DISPLAYED = {role: frozenset(pages) for role, pages in ROUTES.items()}
+
+startup.done('pages')
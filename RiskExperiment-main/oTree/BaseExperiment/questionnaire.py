@@ -0,0 +1,204 @@
+"""Post-experiment questionnaire
+
+Declares the Likert scales of the questionnaire once: item labels, answer anchors,
+reverse-coded items and the pages showing them to each role.
+models.py builds the player fields from it, pages.py the form pages and scoring.py the scales,
+so a wording change or a new item is made here only.
+Plain data without oTree imports, to be usable offline by the scoring.
+"""
+
+# roles, by id_in_group
+MANAGER = 1
+SUPERVISOR = 2
+
+# answer anchors, from the lowest to the highest point; unlabelled points are ''
+AGREE7 = ('Strongly disagree', '', '', '', '', '', 'Strongly agree')
+AGREE5 = ('Strongly disagree', '', '', '', 'Strongly agree')
+MUCH7 = ('Little', '', '', '', '', '', 'Very much')
+ACCURATE7 = ('Very inaccurate', '', '', '', '', '', 'Very accurate')
+BELOW_AVERAGE = ('Way below the average', '', 'Average', '', 'Way above the average')
+BELOW_EXPECTATION = ('Way below my expectation', '', 'In line with my expectation', '', 'Way above my expectation')
+
+CHOICES = {}
+
+
+def choices(anchors):
+    """Form choices of an anchor set, shared by all items using it"""
+    if anchors not in CHOICES:
+        CHOICES[anchors] = [[point, label] for point, label in enumerate(anchors, 1)]
+    return CHOICES[anchors]
+
+
+class Item:
+    def __init__(self, name, label, anchors, reverse=False):
+        self.name = name
+        self.label = label
+        self.anchors = anchors
+        self.reverse = reverse
+
+    @property
+    def points(self):
+        return len(self.anchors)
+
+
+class Scale:
+    """Items <name>1..<name>n, numbered in the order of their labels
+
+    A label may be given as (label, anchors) to override the anchors of the scale.
+    Scales with scored=False are asked but have no construct score.
+    """
+
+    def __init__(self, name, anchors, labels, reverse=(), scored=True):
+        self.name = name
+        self.scored = scored
+        self.items = []
+        for number, label in enumerate(labels, 1):
+            item_anchors = anchors
+            if isinstance(label, tuple):
+                label, item_anchors = label
+            self.items.append(Item(f"{name}{number}", label, item_anchors, number in reverse))
+
+    @property
+    def fields(self):
+        return [item.name for item in self.items]
+
+
+SCALES = [
+    Scale('closure', AGREE7, [
+        'I did not disclose all relevant risk information to the supervisor.',
+        'I did not devote much effort to reporting risks to the supervisor.',
+        'I honestly reported all the risk information that I had to the supervisor.',
+        'I reported the risk information that I had to the supervisor as objectively as possible.',
+        'I felt that my risk report was quite informative.',
+        'I did not give an accurate account of the risks that I faced to the supervisor.',
+        'I withheld some unfavorable information from the supervisor.',
+        'I focused on favorable information more than unfavorable information in my risk report.',
+        'I tried to cover up some unfavorable news by emphasizing the favorable information.',
+        'I did not include information that had negative implications for my performance evaluation.',
+        'I felt responsible to inform the supervisor about the risks I was exposed to.',
+        'It was my responsibility to provide the supervisor with the detailed information about the potential risks which I faced.',
+    ], reverse=(3, 4, 5, 11, 12)),
+    Scale('S', MUCH7, [
+        'How informative the risk report of the shop manager was?',
+        'To what extent do you think the shop manager provided all relevant risk information to you?',
+        'How detailed the risk report of the shop manager was?',
+        'How useful did you find the risk report of the shop manager for the risk management purposes? ',
+        'How accurate did you find the risk report of the shop manager?',
+        'How severe did you find the potential risks to the shop given the report of the shop manager?',
+    ], scored=False),
+    Scale('importance', MUCH7, [
+        '...placed importance on risk management?',
+        '...placed emphasis on the timely communication of risk information?',
+        '...placed value on open sharing of risk information?',
+        '...facilitated communication of risk information?',
+    ]),
+    Scale('image', AGREE7, [
+        '...the superior would have a negative image of me',
+        '...my image in the eyes of the supervisor would be improved',
+        '...I would look bad in the eyes of the supervisor',
+        '...the supervisor would think better of me',
+        '...the supervisor would think worse of me',
+        '...the supervisor would appreciate it',
+        '...the supervisor would penalize me',
+    ], reverse=(2, 4, 6)),
+    Scale('factor', MUCH7, [
+        '..report the risks that you faced to the supervisor?',
+        '..show the supervisor that you made the right location choice?',
+        '..report risks in such a way that could have positively impact your performance evaluation?',
+        '..look good in the eyes of the supervisor?',
+        '..look competent in the eyes of the supervisor?',
+        '..avoid creating a negative impression on the supervisor?',
+        '..be honest in your report?',
+    ]),
+    Scale('trust', AGREE7, [
+        'I felt that the company trusts me to report risks.',
+        'The firm risk reporting policy showed that the firm does not trust its employees.',
+        'The firm risk reporting policy was a clear sign of distrust in employees.',
+    ], reverse=(1,)),
+    Scale('oblig', AGREE7, [
+        'I felt obliged to disclose the risk information that I had to the supervisor.',
+        'I felt that I can easily share the risks to my sales revenue to the supervisor.',
+        'I felt that I can openly share unfavorable risk information with the supervisor without being punished.',
+        'I felt that the risks I faced were because of the decision that I had taken. ',
+        'I felt that I should manage the risks that I faced on my own. ',
+        'I felt that the risks were not so severe for the company. ',
+        'I felt that the potential impacts of a new competitor on the sales performance is serious.',
+    ]),
+    Scale('perf', None, [
+        ('', BELOW_AVERAGE),
+        ('', BELOW_EXPECTATION),
+    ], scored=False),
+    Scale('safety', ACCURATE7, [
+        'If you make a mistake in this company, it is often held against you.',
+        'Members of this company are able to bring up problems and tough issues.',
+        'People in this organization sometimes reject others for being different.',
+        'It is safe to take risks in this company.',
+        'It is difficult to ask other members of this company for help.',
+        'No one in this company would deliberately act in a way that undermines my efforts.',
+        'Working with members of this company, my unique skills and talents are valued and utilized.',
+    ], reverse=(1, 3, 5)),
+    Scale('manvol', ACCURATE7, [
+        'The company requires its managers to report to their supervisors the risks they are exposed to.',
+        'In this company, it is compulsory for managers to report the risks they face to the superior in their performance reports.',
+        'In this company, managers are mandated to disclose the risks they face.',
+    ], scored=False),
+    Scale('reason', AGREE7, [
+        'To encourage honesty and trust.',
+        'To facilitate timely communication of risk information.',
+        'To collect important risk information and manage them at the firm level.',
+        'To fit the culture of the company.',
+        'To evaluate the decisions of the managers.',
+    ], scored=False),
+    Scale('riskat', AGREE7, [
+        'I can be rather incautious and take big risks.',
+        'I often dare to do risky things which other people are reluctant to do.',
+        'I am always very cautious and think of safety first.',
+        'I always try to avoid situations involving a risk of getting into trouble with other people.',
+        'I like to avoid doing things for which I run the risk of being criticized and blamed if I fail.',
+    ], reverse=(3, 4, 5)),
+    Scale('opt', AGREE7, [
+        'In uncertain times, I usually expect the best.',
+        'I rarely count on good things happening to me.',
+        'Overall, I expect more good things to happen to me than bad.',
+    ], reverse=(2,)),
+    Scale('unc', AGREE7, [
+        'Unforeseen events upset me greatly.',
+        'It frustrates me not having all information I need.',
+        'I cannot stand being taken by surprises.',
+    ]),
+    Scale('gen', AGREE5, [
+        'My task was boring.',
+        'May task was difficult.',
+        'I enjoyed participating in this study.',
+        'The instructions were clearly formulated.',
+    ], scored=False),
+]
+
+ITEMS = {item.name: item for scale in SCALES for item in scale.items}
+
+
+def fields(*scales):
+    """Fields of the named scales, in order"""
+    named = {scale.name: scale for scale in SCALES}
+    return [field for name in scales for field in named[name].fields]
+
+
+# page -> form fields, role shown to (None: both)
+PAGES = {
+    'Post1Quality2temp': (fields('S'), SUPERVISOR),
+    'Post1Quality1': (fields('closure')[:6], MANAGER),
+    'Post1Quality2': (fields('closure')[6:], MANAGER),
+    'N7SAssess': (fields('S'), SUPERVISOR),
+    'Post2importance': (fields('importance'), None),
+    'Post3image1': (fields('image'), MANAGER),
+    'Post4factor': (fields('factor'), MANAGER),
+    'Post5trust': (fields('trust'), MANAGER),
+    'Post6oblig': (fields('oblig'), MANAGER),
+    'Post7perf': (fields('perf'), MANAGER),
+    'Post8mansafetycheck': (fields('safety'), None),
+    'Post9manvoluntarycheck': (fields('manvol'), None),
+    'Post10volexp': (fields('reason'), None),
+    'Post11riskattitude1': (fields('riskat'), None),
+    'Post12optimism': (fields('opt', 'unc'), None),
+    'Post15GenQuest': (fields('gen') + ['comment'], None),
+}
@@ -1,41 +1,187 @@
 """Sandwich orders factory"""
-import yaml
-try:
-    from yaml import CLoader as Loader
-except ImportError:
-    from yaml import Loader
+import hashlib
+import json
+import os
+import pickle
+import random
 from pathlib import Path
 
+from . import startup
+
 
 datapath = Path(__file__).parent / "datafiles"
 recfile = datapath / "recipes.yaml"
 ingfile = datapath / "ingredients.yaml"
+imgdir = Path(__file__).parent / "static" / "sandwiches" / "images"
+builddir = imgdir.parent / "build"
+manifestfile = builddir / "manifest.json"
+# compiled yaml, rebuilt whenever the yaml files change
+cachefile = datapath / "menu.cache"
+
+
+def yaml_loader():
+    import yaml
+    try:
+        return yaml, yaml.CLoader
+    except AttributeError:
+        return yaml, yaml.Loader
 
 
 def load_recipes():
+    yaml, Loader = yaml_loader()
     with open(recfile) as f:
         return yaml.load(f, Loader=Loader)
 
 
 def load_ingredients():
+    yaml, Loader = yaml_loader()
     with open(ingfile) as f:
         return yaml.load(f, Loader=Loader)
 
 
-def images_map(ingredients):    
+def sources_key():
+    """Identifies current version of the yaml files by their size and mtime"""
+    return tuple((st.st_size, st.st_mtime_ns) for st in (os.stat(recfile), os.stat(ingfile)))
+
+
+def load_compiled():
+    """Loads recipes and ingredients from the compiled cache,
+    parsing the yaml and rewriting the cache if it is missing or outdated
+    Returns: recipes, ingredients
+    """
+    key = sources_key()
+    try:
+        with open(cachefile, "rb") as f:
+            cached = pickle.load(f)
+        if cached['key'] == key:
+            return cached['recipes'], cached['ingredients']
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+        pass
+
+    recipes, ingredients = load_recipes(), load_ingredients()
+    try:
+        tmp = cachefile.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(dict(key=key, recipes=recipes, ingredients=ingredients), f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cachefile)
+    except OSError:
+        pass  # read-only deployment, parse again next time
+    return recipes, ingredients
+
+
+def load_manifest():
+    """Manifest of built images (see images.py), None if not built"""
+    if not manifestfile.exists():
+        return None
+    with open(manifestfile) as f:
+        return json.load(f)
+
+
+def images_map(ingredients, manifest=None):
+    """Inline css background of every ingredient layer
+    Uses the sprite sheet from the manifest, WebP where the browser supports it (image-set)
+    and JPEG otherwise, or the original jpegs without a manifest.
+    """
     #from django.templatetags.static import static  # it doesn't work properly in otree
 
     def image_url(ingredient):
         name = ingredient.lower().replace(' ', '_')
         return f"/static/sandwiches/images/{name}.jpg"
 
+    def sprite_style(ingredient):
+        width, height = manifest['tile']
+        y = manifest['images'][ingredient]['y']
+        webp, jpeg = f"/static/{manifest['sprite']}", f"/static/{manifest['fallback']}"
+        return (f"background-image: url({jpeg}); "
+                f'background-image: image-set(url({webp}) type("image/webp"), url({jpeg}) type("image/jpeg")); '
+                f"background-position: 0 -{y}px; background-size: {width}px {manifest['height']}px")
+
     images = {}
     for category, items in ingredients.items():
         for item in items:
-            images[item] = image_url(item)
+            if manifest is not None and item in manifest['images']:
+                images[item] = sprite_style(item)
+            else:
+                images[item] = f"background-image: url({image_url(item)})"
     return images
 
 
-RECIPES = load_recipes()
+def ingredient_names(ingredients):
+    """Lists all ingredients, position in the list is ingredient id"""
+    return tuple(item for items in ingredients.values() for item in items)
+
+
+def sandwich_mask(components, count):
+    """Packs a list of ingredient ids into a bitmask
+    Returns: mask, number of distinct unknown components (left out of the mask)
+    """
+    if not isinstance(components, list):
+        return 0, 1
+    mask = 0
+    unknown = None
+    for i in components:
+        if type(i) is not int or not 0 <= i < count:
+            unknown = unknown or []
+            if i not in unknown:
+                unknown.append(i)
+            continue
+        mask |= 1 << i
+    return mask, len(unknown) if unknown else 0
+
+
+def recipe_masks(recipes, names):
+    """Precomputes bitmask of every recipe"""
+    index = {name: i for i, name in enumerate(names)}
+    return {name: sandwich_mask([index[item] for item in items], len(names))[0] for name, items in recipes.items()}
+
+
+def wire_version(recipes, names):
+    """Short hash of the menu and ingredient ids known to the client"""
+    data = json.dumps([recipes, names], sort_keys=False)
+    return hashlib.sha1(data.encode()).hexdigest()[:8]
+
+
+def popcount(mask):
+    """Number of bits set in mask"""
+    return bin(mask).count("1")
+
+
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+
+
+def order_stream(seed, length, menu):
+    """Generates reproducible sequence of orders
+    Returns: list of indices into menu
+    """
+    rng = random.Random(seed)
+    return [rng.randrange(len(menu)) for _ in range(length)]
+
+
+def pack_stream(stream):
+    return ",".join(map(str, stream))
+
+
+def unpack_stream(packed):
+    return [int(i) for i in packed.split(",")]
+
+
+RECIPES, INGREDIENTS = load_compiled()
+
+MENU = tuple(RECIPES)
+
+MANIFEST = load_manifest()
+
+# static path of the sprite sheet, preloaded by the shop pages
+SPRITE = MANIFEST['sprite'] if MANIFEST else None
+
+NAMES = ingredient_names(INGREDIENTS)
+
+MASKS = recipe_masks(RECIPES, NAMES)
+
+# order name -> id (position in MENU), as sent to the client
+ORDER_IDS = {name: i for i, name in enumerate(MENU)}
+
+WIRE_VERSION = wire_version(RECIPES, NAMES)
 
-INGREDIENTS = load_ingredients()
+startup.mark('recipes')
@@ -0,0 +1,77 @@
+"""Record and replay of live traffic
+
+Every message received by the live methods of the shop pages is appended to the session event log
+(see events.py) as a 'message' record: live method, player slot (id_in_subsession),
+wall clock time and the message as sent. With the order seed of the 'session' record,
+this is enough to replay a lab session: each slot gets the same orders again
+and sends the same sandwiches at the same moments.
+
+Replay into a fresh session of the database configured for the project:
+
+    otree replay_live _events/events-x7k2m9qa.jsonl --speed 10
+
+--speed 1 keeps the recorded pace, 10 plays ten times faster, 0 sends without waiting.
+Recordings of another menu (WIRE_VERSION) are refused, as their sandwiches
+refer to ingredient ids of that menu and every message would be answered with a reload.
+"""
+import collections
+import functools
+import time
+
+from . import events
+from .events import EVENTS, session_code
+
+
+def recorded(name):
+    """Wraps the player live method name, appending each received message to the event log"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(player, message):
+            EVENTS.emit(session_code(player), 'message', method=name, slot=player.id_in_subsession,
+                        wall=time.time(), message=message)
+            return method(player, message)
+        return wrapper
+    return decorate
+
+
+def load(path):
+    """Reads the live traffic of a session event log
+    Returns: order seed (None if not recorded), list of (seconds from first message, slot, method, message)
+    """
+    seed = None
+    messages = []
+    for record in events.load(path):
+        if record['kind'] == 'session':
+            seed = record['order_seed']
+        elif record['kind'] == 'message':
+            messages.append((record['wall'], record['slot'], record['method'], record['message']))
+    # writer threads of several processes may interleave
+    messages.sort(key=lambda m: m[0])
+    started = messages[0][0] if messages else 0
+    return seed, [(wall - started, slot, method, message) for wall, slot, method, message in messages]
+
+
+def wire_version(messages):
+    """Returns: the wire version most recorded messages were sent with
+    (a few may come from stale clients), None if none carries one
+    """
+    counts = collections.Counter(message.get('v') for _, _, _, message in messages if isinstance(message, dict))
+    return counts.most_common(1)[0][0] if counts else None
+
+
+def replay(messages, send, speed=1.0, clock=time.monotonic, sleep=time.sleep):
+    """Calls send(slot, method, message) for each message, at its offset divided by speed
+    (speed 0: without waiting)
+    Returns: seconds of the replay, largest delay behind schedule
+    """
+    started = clock()
+    behind = 0.0
+    for offset, slot, method, message in messages:
+        if speed:
+            wait = started + offset / speed - clock()
+            if wait > 0:
+                sleep(wait)
+            else:
+                behind = max(behind, -wait)
+        send(slot, method, message)
+    return clock() - started, behind
@@ -0,0 +1,107 @@
+"""Construct scores of the post-experiment questionnaire
+
+Scores the player export (see export.py) of all sessions at once:
+
+    python -m BaseExperiment.scoring players.csv [scored.csv]
+
+For every scale of questionnaire.py it computes the mean of its items (after reverse coding),
+a flag for participants with missing items, and Cronbach's alpha over complete cases.
+Requires numpy.
+"""
+import csv
+import sys
+
+import numpy as np
+
+from . import questionnaire
+
+# scale -> items, reverse-coded items, number of scale points
+SCALES = {
+    scale.name: (
+        scale.fields,
+        [item.name for item in scale.items if item.reverse],
+        scale.items[0].points,
+    )
+    for scale in questionnaire.SCALES if scale.scored
+}
+
+
+def load_csv(path):
+    """Reads an export into columns
+    Returns: column name -> list of raw values
+    """
+    with open(path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        values = list(zip(*reader)) or [()] * len(header)
+    return dict(zip(header, (list(v) for v in values)))
+
+
+def item_matrix(columns, items):
+    """Stacks item columns into a float matrix (participants x items), NaN for missing"""
+    def numeric(values):
+        return np.array([float(v) if v not in ('', None) else np.nan for v in values], dtype=float)
+    return np.column_stack([numeric(columns[item]) for item in items])
+
+
+def cronbach_alpha(x):
+    """Cronbach's alpha of a participants x items matrix, over complete rows"""
+    x = x[~np.isnan(x).any(axis=1)]
+    n, k = x.shape
+    if n < 2 or k < 2:
+        return np.nan
+    item_var = x.var(axis=0, ddof=1).sum()
+    total_var = x.sum(axis=1).var(ddof=1)
+    if total_var == 0:
+        return np.nan
+    return k / (k - 1) * (1 - item_var / total_var)
+
+
+def score(columns, scales=SCALES):
+    """Scores all participants
+    Returns: scores (name -> array; <scale> means and <scale>_missing flags), alphas (scale -> float)
+    """
+    scores = {}
+    alphas = {}
+    for scale, (items, reverse, points) in scales.items():
+        if not all(item in columns for item in items):
+            continue
+        x = item_matrix(columns, items)
+        flip = np.isin(items, reverse)
+        x[:, flip] = points + 1 - x[:, flip]
+        missing = np.isnan(x)
+        answered = (~missing).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scores[scale] = np.where(answered > 0, np.nansum(x, axis=1) / answered, np.nan)
+        scores[f"{scale}_missing"] = missing.any(axis=1)
+        alphas[scale] = cronbach_alpha(x)
+    return scores, alphas
+
+
+def write_csv(path, columns, scores, keys=('session', 'participant')):
+    names = [key for key in keys if key in columns] + list(scores)
+    data = [columns[key] for key in keys if key in columns] + [scores[name] for name in scores]
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(names)
+        for row in zip(*data):
+            writer.writerow(['' if isinstance(v, float) and np.isnan(v) else v for v in row])
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(__doc__)
+        return 2
+    columns = load_csv(argv[0])
+    scores, alphas = score(columns)
+    for scale, alpha in alphas.items():
+        missing = int(scores[f"{scale}_missing"].sum())
+        print(f"{scale:12} alpha {alpha:6.3f}  missing {missing}")
+    if len(argv) > 1:
+        write_csv(argv[1], columns, scores)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
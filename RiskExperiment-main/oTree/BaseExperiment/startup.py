@@ -0,0 +1,118 @@
+"""Import-time measurement of the app
+
+Modules of the app mark when their import completes, relative to the import of the package.
+When the last one (pages) is imported, the timings are appended as one JSON line
+to STARTUP_LOG, if set, to track worker cold start after each restart.
+
+With IMPORT_AUDIT set, the import of every module and the construction of every class
+of the app are timed as well, and a table of the slowest ones is printed to stderr.
+"""
+import builtins
+import json
+import os
+import sys
+import time
+
+STARTED = time.perf_counter()
+
+# module -> seconds since package import, in order of completion
+MARKS = {}
+
+PACKAGE = __name__.rpartition('.')[0]
+
+
+class Audit:
+    """Times imports of app modules and construction of app classes
+    by wrapping builtins.__import__ and builtins.__build_class__
+    """
+
+    def __init__(self):
+        # module -> [inclusive seconds, own seconds]
+        self.modules = {}
+        # module.class -> seconds
+        self.classes = {}
+        self.stack = []
+        self.original_import = builtins.__import__
+        self.original_build_class = builtins.__build_class__
+
+    def install(self):
+        builtins.__import__ = self.timed_import
+        builtins.__build_class__ = self.timed_build_class
+
+    def uninstall(self):
+        builtins.__import__ = self.original_import
+        builtins.__build_class__ = self.original_build_class
+
+    def resolve(self, name, globals, level):
+        if level and globals:
+            base = globals.get('__package__') or ''
+            base = base.rsplit('.', level - 1)[0] if level > 1 else base
+            return f"{base}.{name}" if name else base
+        return name
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        module = self.resolve(name, globals, level)
+        if module in sys.modules:
+            # from package import submodule
+            package = sys.modules[module]
+            targets = [
+                f"{module}.{item}" for item in fromlist or ()
+                if hasattr(package, '__path__') and not hasattr(package, item)
+            ]
+        else:
+            targets = [module]
+        if not module.startswith(PACKAGE) or not targets:
+            return self.original_import(name, globals, locals, fromlist, level)
+        self.stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self.original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = self.stack.pop()
+            if self.stack:
+                self.stack[-1] += elapsed
+            self.modules[", ".join(targets)] = [elapsed, elapsed - children]
+
+    def timed_build_class(self, func, name, *bases, **kwargs):
+        module = func.__globals__.get('__name__', '')
+        if not module.startswith(PACKAGE):
+            return self.original_build_class(func, name, *bases, **kwargs)
+        started = time.perf_counter()
+        try:
+            return self.original_build_class(func, name, *bases, **kwargs)
+        finally:
+            self.classes[f"{module}.{name}"] = time.perf_counter() - started
+
+    def report(self, limit=15):
+        lines = ["import audit (ms)", "  modules: inclusive / own"]
+        for module, (inclusive, own) in sorted(self.modules.items(), key=lambda i: -i[1][1]):
+            lines.append(f"    {module:40} {inclusive * 1000:8.1f} {own * 1000:8.1f}")
+        lines.append(f"  classes: slowest {limit} of {len(self.classes)}")
+        for name, seconds in sorted(self.classes.items(), key=lambda i: -i[1])[:limit]:
+            lines.append(f"    {name:40} {seconds * 1000:8.2f}")
+        return "\n".join(lines)
+
+
+AUDIT = Audit() if os.environ.get("IMPORT_AUDIT") else None
+
+if AUDIT is not None:
+    AUDIT.install()
+
+
+def mark(name):
+    MARKS[name] = time.perf_counter() - STARTED
+
+
+def done(name):
+    """Marks the last module and writes the record"""
+    mark(name)
+    record = dict(pid=os.getpid(), wall=time.time(), total=MARKS[name], marks=MARKS)
+    if AUDIT is not None:
+        AUDIT.uninstall()
+        record.update(modules=AUDIT.modules, classes=AUDIT.classes)
+        print(AUDIT.report(), file=sys.stderr)
+    path = os.environ.get("STARTUP_LOG")
+    if path:
+        with open(path, "a") as f:
+            f.write(json.dumps(record) + "\n")
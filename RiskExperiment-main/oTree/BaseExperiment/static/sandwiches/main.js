@@ -45,6 +45,7 @@ class View {
             var ctrl = $(ev.target).parents('.input-group').find('select');
             var name = ctrl.val();
             ctrl.val("");
+            if (!name) return;
             this.$root.trigger('addComponent', {component: name});
         })
 
@@ -71,7 +72,7 @@ class View {
     }
 
     renderOrder() {
-        this.$order.text(this.game.order);
+        this.$order.text(this.game.order === null ? "" : MENU.orders[this.game.order]);
     }
 
     renderTimer(time) {
@@ -88,7 +89,7 @@ class View {
         var sandwich = this.game.assembled;
         this.$assembly.empty()
         this.$assembly.append(sandwich.map((name, idx) => `
-            <li style="background-image: url(${js_vars.images[name]})">
+            <li style="${MENU.images[name]}">
                 <span class="badge badge-light">${name}</span>
                 <button type="button" class="btn btn-sm del-btn" data-idx="${idx}">❌</button>
             </li>`));
@@ -97,7 +98,7 @@ class View {
     }
 
     showRecipe(name) {
-        var recipe = js_vars.menu[name];
+        var recipe = MENU.menu[name];
         var $recipe = this.$recipe.find('ul');
         $recipe.empty();
         $recipe.append(recipe.map((item) => `<li>${item}</li>`));
@@ -118,12 +119,21 @@ class View {
 }
 
 
+// messages sent within this delay (ms) are coalesced into one frame
+const SEND_DELAY = 50;
+
+
 class Controller {
     /** Main logic of communication with user and server */
     constructor(game, view) {
         this.game = game;
         this.view = view;
         this.timeout = this.game.duration;
+        this.outbox = [];
+
+        // ingredients travel as ids, positions in MENU.ingredients
+        this.ids = {};
+        MENU.ingredients.forEach((name, id) => this.ids[name] = id);
 
         // handling received messages
         // recieved can be single message or am array of messages
@@ -136,6 +146,10 @@ class Controller {
                     this.recvOrder(msg);
                 } else if(msg.type == 'error') {
                     this.recvError(msg);
+                } else if(msg.type == 'reload') {
+                    // the server has a newer menu than this page
+                    window.location.reload();
+                    return;
                 } else {
                     console.error("Unrecognized message:", msg);
                 }
@@ -156,7 +170,7 @@ class Controller {
     }
 
     recvOrder(msg) {
-        // received new order
+        // received new order (id of the recipe in MENU.orders)
         this.game.order = msg.order;
         this.view.renderOrder();
         this.game.resetSandwich();
@@ -169,14 +183,33 @@ class Controller {
         this.view.showError(`${msg.mismatches} ingredients mismatched`);
     }
 
+    send(msg) {
+        // queueing message to be sent with others sent close together
+        var last = this.outbox[this.outbox.length - 1];
+        if (last && JSON.stringify(last) == JSON.stringify(msg)) return;  // double submit
+        this.outbox.push(msg);
+        if (this.outbox.length == 1) {
+            window.setTimeout(() => this.flush(), SEND_DELAY);
+        }
+    }
+
+    flush() {
+        // sending queued messages, as a list if there are several
+        var msgs = this.outbox;
+        this.outbox = [];
+        if (msgs.length == 0) return;
+        window.liveSend(msgs.length == 1 ? msgs[0] : msgs);
+    }
+
     sendStart() {
         // sending start game request
-        window.liveSend({type: 'start'});
+        this.send({type: 'start', v: js_vars.version});
     }
 
     sendSendwich() {
         // submitting sandwich
-        window.liveSend({'type': 'sandwich', 'components': this.game.assembled});
+        var components = this.game.assembled.map((name) => this.ids[name]);
+        this.send({'type': 'sandwich', 'v': js_vars.version, 'components': components});
     }
 
     addComponent(item) {
@@ -219,6 +252,7 @@ class Controller {
 
     finish() {
         // completing game - submit whole page form
+        this.flush();
         $("#form").submit();
     }
 }
@@ -233,6 +267,6 @@ $(function() {
 })
 
 function complete() {
-    game.assembled = js_vars.menu[game.order].slice();
+    game.assembled = MENU.menu[MENU.orders[game.order]].slice();
     view.renderSandwich();
 }
\ No newline at end of file
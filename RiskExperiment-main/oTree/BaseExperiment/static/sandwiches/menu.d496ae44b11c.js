@@ -0,0 +1 @@
+window.MENU = {"version":"c6a0752c","menu":{"Pimento":["White bread","Bacon","Monterey Jack cheese","Onion","Avocado","Mayonnaise","Salt"],"Grandwich":["Whole grain bread","Bacon","American cheese","Tomato","Salt","Garlic powder","Black pepper"],"Bel-air-club":["White bread","Ham","Turkey","Gruyere cheese","Celery","Salt","Hot sauce"],"Pan bagnat":["Rustic bread","Tuna","Cucumber","Tomato","Mustard","Black pepper","Salt"],"Hot chicken sandwich":["Italian bread","Chicken","White cheddar","Tomato","Red pepper","Black pepper","Hot sauce"],"Fried chicken sandwich":["Baguette","Chicken","White cheddar","Parsley","Green onion","Salt","Mayonnaise"],"Alabama chicken sandwich":["Burger bun","Chicken","Smoked gouda","Celery","Corn","Black cumin","Mayonnaise"],"Amy's triple":["White bread","Turkey","Bacon","Sharp cheddar","Lettuce","Tomato","Mayonnaise"],"Chivito":["Burger bun","Beef steak","Ham","Mozarella","Tomato","Black pepper","Mayonnaise"],"Tuna sandwich":["Baguette","Tuna","Cream cheese","Green onion","Parsley","Salt","Black pepper"],"Pear Brunch":["Focaccia bread","Bacon","Blue cheese","Carrot","Lettuce","Corn","Mayonnaise"],"Lexington":["Whole grain bread","Bacon","White cheddar","Onion","Ketchup","Paprika","Black pepper"],"Aussie lamb sandwich":["Burger bun","Lamb steak","Lettuce","Tomato","Ketchup","Black pepper","Garlic powder"],"Mediterranean lamb sandwich":["Baguette","Lamb steak","Cream cheese","Parsley","Spinach","Red pepper","Garlic powder"],"Greek lamb":["Burger bun","Lamb steak","Smoked gouda","Onion","Mushroom","Black pepper","Ketchup"],"Maple turkey":["Whole grain bread","Turkey","Swiss cheese","Lettuce","Tomato","Black cumin","Mustard"],"Shrimp salad sandwich":["Burger bun","Shrimp","Tomato","Celery","Spinach","Mustard","Salt"],"Jerk shrimp sandwich":["White bread","Shrimp","Mushroom","Green onion","Corn","Red pepper","Soy sauce"],"Bacon Jack chicken sandwich":["Burger bun","Chicken","Bacon","Pepper Jack cheese","Lettuce","Tomato","Red pepper"],"Fried shrimp sandwich":["White bread","Shrimp","Cream cheese","Onion","Tomato","Salt","Black cumin"],"Hamburger":["Burger bun","Beef steak","Lettuce","Tomato","Black pepper","Salt","Ketchup"],"Cheese burger":["Burger bun","Beef steak","Lettuce","White cheddar","Tomato","Corn","Onion","Black pepper"],"Creamy mushroom burger":["Burger bun","Beef steak","Cream cheese","Lettuce","Mushroom","Salt","Black pepper"],"Korean burger":["Burger bun","Beef steak","Lettuce","Corn","Green onion","Mayonnaise","Salt"],"Piggy burger":["Burger bun","Beef steak","Green onion","Green cabbage","Paprika","Soy sauce","Mustard"],"Asian chicken burger":["Burger bun","Chicken","Green cabbage","Lettuce","Ginger","Soy sauce","Red pepper"],"Tai salmon burger":["Burger bun","Salmon","Onion","Avocado","Carrot","Ginger","Hot sauce"],"Salmon club sandwich":["Whole grain bread","Salmon","Radish","Corn","Parsley","Avocado","Mayonnaise"],"Italian sausage":["Italian bread","Sausage","Onion","Tomato","Ketchup","Black pepper","Salt"],"Spicy sausage":["Baguette","Sausage","Green onion","Lettuce","Potato","Hot sauce","Red pepper"],"Crab club sandwich":["Burger bun","Crab","Radish","Celery","Onion","Lettuce","Mayonnaise"],"Spicy crab sandwich":["Burger bun","Crab","Green onion","Mushroom","Potato","Hot sauce","Red pepper"]},"orders":["Pimento","Grandwich","Bel-air-club","Pan bagnat","Hot chicken sandwich","Fried chicken sandwich","Alabama chicken sandwich","Amy's triple","Chivito","Tuna sandwich","Pear Brunch","Lexington","Aussie lamb sandwich","Mediterranean lamb sandwich","Greek lamb","Maple turkey","Shrimp salad sandwich","Jerk shrimp sandwich","Bacon Jack chicken sandwich","Fried shrimp sandwich","Hamburger","Cheese burger","Creamy mushroom burger","Korean burger","Piggy burger","Asian chicken burger","Tai salmon burger","Salmon club sandwich","Italian sausage","Spicy sausage","Crab club sandwich","Spicy crab sandwich"],"ingredients":["Baguette","Burger bun","Focaccia bread","Italian bread","Rustic bread","White bread","Whole grain bread","Beef steak","Bacon","Chicken","Crab","Ham","Lamb steak","Salmon","Sausage","Shrimp","Tuna","Turkey","American cheese","Blue cheese","Cream cheese","Gruyere cheese","Pepper Jack cheese","Monterey Jack cheese","Mozarella","Sharp cheddar","Smoked gouda","Swiss cheese","White cheddar","Avocado","Carrot","Celery","Corn","Cucumber","Green onion","Green cabbage","Lettuce","Mushroom","Onion","Parsley","Potato","Radish","Spinach","Tomato","Black cumin","Black pepper","Garlic powder","Ginger","Hot sauce","Ketchup","Mayonnaise","Mustard","Paprika","Red pepper","Salt","Soy sauce"],"images":{"Baguette":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -0px; background-size: 320px 2688px","Burger bun":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -48px; background-size: 320px 2688px","Focaccia bread":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -96px; background-size: 320px 2688px","Italian bread":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -144px; background-size: 320px 2688px","Rustic bread":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -192px; background-size: 320px 2688px","White bread":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -240px; background-size: 320px 2688px","Whole grain bread":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -288px; background-size: 320px 2688px","Beef steak":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -336px; background-size: 320px 2688px","Bacon":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -384px; background-size: 320px 2688px","Chicken":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -432px; background-size: 320px 2688px","Crab":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -480px; background-size: 320px 2688px","Ham":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -528px; background-size: 320px 2688px","Lamb steak":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -576px; background-size: 320px 2688px","Salmon":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -624px; background-size: 320px 2688px","Sausage":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -672px; background-size: 320px 2688px","Shrimp":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -720px; background-size: 320px 2688px","Tuna":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -768px; background-size: 320px 2688px","Turkey":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -816px; background-size: 320px 2688px","American cheese":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -864px; background-size: 320px 2688px","Blue cheese":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -912px; background-size: 320px 2688px","Cream cheese":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -960px; background-size: 320px 2688px","Gruyere cheese":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1008px; background-size: 320px 2688px","Pepper Jack cheese":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1056px; background-size: 320px 2688px","Monterey Jack cheese":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1104px; background-size: 320px 2688px","Mozarella":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1152px; background-size: 320px 2688px","Sharp cheddar":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1200px; background-size: 320px 2688px","Smoked gouda":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1248px; background-size: 320px 2688px","Swiss cheese":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1296px; background-size: 320px 2688px","White cheddar":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1344px; background-size: 320px 2688px","Avocado":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1392px; background-size: 320px 2688px","Carrot":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1440px; background-size: 320px 2688px","Celery":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1488px; background-size: 320px 2688px","Corn":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1536px; background-size: 320px 2688px","Cucumber":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1584px; background-size: 320px 2688px","Green onion":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1632px; background-size: 320px 2688px","Green cabbage":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1680px; background-size: 320px 2688px","Lettuce":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1728px; background-size: 320px 2688px","Mushroom":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1776px; background-size: 320px 2688px","Onion":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1824px; background-size: 320px 2688px","Parsley":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1872px; background-size: 320px 2688px","Potato":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1920px; background-size: 320px 2688px","Radish":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -1968px; background-size: 320px 2688px","Spinach":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2016px; background-size: 320px 2688px","Tomato":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2064px; background-size: 320px 2688px","Black cumin":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2112px; background-size: 320px 2688px","Black pepper":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2160px; background-size: 320px 2688px","Garlic powder":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2208px; background-size: 320px 2688px","Ginger":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2256px; background-size: 320px 2688px","Hot sauce":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2304px; background-size: 320px 2688px","Ketchup":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2352px; background-size: 320px 2688px","Mayonnaise":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2400px; background-size: 320px 2688px","Mustard":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2448px; background-size: 320px 2688px","Paprika":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2496px; background-size: 320px 2688px","Red pepper":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2544px; background-size: 320px 2688px","Salt":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2592px; background-size: 320px 2688px","Soy sauce":"background-image: url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg); background-image: image-set(url(/static/sandwiches/build/sprite.ba753d3b335d.webp) type(\"image/webp\"), url(/static/sandwiches/build/sprite.6c46361b0da8.jpeg) type(\"image/jpeg\")); background-position: 0 -2640px; background-size: 320px 2688px"}};
@@ -1,9 +1,159 @@
-from otree.api import Currency as c, currency_range
+import random
+
+from otree.api import Currency as c, currency_range, Submission, SubmissionMustFail, expect
 from . import pages
 from ._builtin import Bot
 from .models import Constants
+from .recipes import RECIPES, MENU, NAMES, WIRE_VERSION
+from .timings import decode
+
+# number of sandwich submissions per live page
+SANDWICHES = {pages.M3Shop: 10, pages.M12Round1: 30}
+
+
+def likert(fields, value=4):
+    return {field: value for field in fields}
 
 
 class PlayerBot(Bot):
+    """Plays the whole page sequence for both roles
+    Shop manager (id 1) plays the live pages through call_live_method,
+    both roles first fail the comprehension survey and then pass it.
+    """
+
     def play_round(self):
-        pass
+        manager = self.player.id_in_group == 1
+        group = self.group
+
+        yield pages._PreStartIntro
+        yield pages.M1IntroPage
+        yield pages.M2IntroPage2
+        yield pages.M3PlayerIntroPage
+
+        if manager:
+            yield Submission(pages.M3Shop, check_html=False)
+            yield pages.M4LocationChoice1
+            yield pages.M4LocationChoice2, dict(NLocationChoice=random.choice([1, 2]))
+        else:
+            yield pages.N1SPLocation
+        if manager:
+            yield pages.M5LocationApproval
+
+        yield pages.M6CultureCondition
+        yield pages.M7procedure
+
+        if manager:
+            expect(self.player.performed, '>', 0)
+            yield pages.M10AfterPractice
+            expect(self.player.performed, 0)
+
+        other_role = 3 - self.player.id_in_group
+        yield SubmissionMustFail(pages.M11ComprehensionSurvey1, dict(Q1=other_role, Q2=2, Q3=1, Q4=1, Q5=1))
+        yield pages.M11ComprehensionSurvey1, dict(Q1=self.player.id_in_group, Q2=1, Q3=2, Q4=2, Q5=3)
+
+        policy = 1 if group.reportingcondition == 'mandatory' else 2
+        culture = 1 if group.culturecondition == 'supportive' else 2
+        yield SubmissionMustFail(pages.M11ComprehensionSurvey2, dict(Q6=3 - policy, Q7=3 - culture, Q8=3 - culture))
+        yield pages.M11ComprehensionSurvey2, dict(Q6=policy, Q7=culture, Q8=culture)
+
+        if manager:
+            yield Submission(pages.M12Round1, check_html=False)
+            expect(self.player.performed, '>', 0)
+            expect(self.player.errors, '>', 0)
+            expect(len(decode(self.player.ordertimes)), self.player.performed)
+            yield pages.M13AfterRound1Game
+            yield pages.M14RiskEvent
+            if group.reportingcondition == 'mandatory':
+                yield pages.M15ReportingScreen, dict(NReportedRiskManD="A competitor may open nearby.")
+            else:
+                yield pages.M15ReportingScreen, dict(NReportedRiskVol="")
+        else:
+            yield pages.WReport
+            yield pages.WReport2
+            yield pages.N5SPBefReporting
+            yield pages.N6SPEvaluation, dict(Evaluation=random.randint(1, 5))
+
+        if manager:
+            yield pages.M16PostExpQuest
+            yield pages.Post1Quality1, likert(pages.Post1Quality1.form_fields)
+            yield pages.Post1Quality2, likert(pages.Post1Quality2.form_fields)
+        else:
+            yield pages.Post1Quality2temp, likert(pages.Post1Quality2temp.form_fields)
+
+        yield pages.Post2importance, likert(pages.Post2importance.form_fields)
+
+        if manager:
+            yield pages.Post3image1, likert(pages.Post3image1.form_fields)
+            yield pages.Post4factor, likert(pages.Post4factor.form_fields)
+            yield pages.Post5trust, likert(pages.Post5trust.form_fields)
+            yield pages.Post6oblig, likert(pages.Post6oblig.form_fields)
+            yield pages.Post7perf, likert(pages.Post7perf.form_fields, 3)
+
+        yield pages.Post8mansafetycheck, likert(pages.Post8mansafetycheck.form_fields)
+        yield pages.Post9manvoluntarycheck, likert(pages.Post9manvoluntarycheck.form_fields)
+        yield pages.Post10volexp, likert(pages.Post10volexp.form_fields)
+        yield pages.Post11riskattitude1, likert(pages.Post11riskattitude1.form_fields)
+        yield pages.Post12optimism, likert(pages.Post12optimism.form_fields)
+        yield pages.Post14gender, dict(gender=3, age=25, WorkExperience=12)
+        yield pages.Post15GenQuest, dict(likert(['gen1', 'gen2', 'gen3', 'gen4'], 3), comment="")
+        yield pages.Results
+
+        # shares were set on leaving the last questionnaire page, and split the whole revenue
+        player = self.player
+        expect(player.ownshare + player.supervisorshare + player.firmshare, player.revenue + player.revenueR1)
+
+
+def sandwich(order):
+    """Ingredient ids of the recipe of an order id"""
+    return [NAMES.index(item) for item in RECIPES[MENU[order]]]
+
+
+def next_submission(rng, order):
+    """Simulates a shop manager: mostly correct sandwiches,
+    some with a missing or extra ingredient, some double submits.
+    Returns: message to send, expected validity (None for a double submit)
+    """
+    components = sandwich(order)
+    roll = rng.random()
+    if roll < 0.15:
+        return dict(type='sandwich', v=WIRE_VERSION, components=components[1:]), False
+    elif roll < 0.25:
+        extra = rng.choice([i for i in range(len(NAMES)) if i not in components])
+        return dict(type='sandwich', v=WIRE_VERSION, components=components + [extra]), False
+    elif roll < 0.35:
+        message = dict(type='sandwich', v=WIRE_VERSION, components=components)
+        return [message, message], None
+    else:
+        return dict(type='sandwich', v=WIRE_VERSION, components=components), True
+
+
+def call_live_method(method, **kwargs):
+    page_class = kwargs['page_class']
+    if page_class not in SANDWICHES:
+        return
+    rng = random.Random(page_class.__name__)
+
+    # a page rendered with another menu is told to reload
+    expect(method(1, dict(type='start', v='stale'))[1], dict(type='reload'))
+
+    reply = method(1, dict(type='start', v=WIRE_VERSION))[1]
+    expect(reply['type'], 'order')
+    order = reply['order']
+
+    for _ in range(SANDWICHES[page_class]):
+        message, valid = next_submission(rng, order)
+        replies = method(1, message)[1]
+        if not isinstance(replies, list):
+            replies = [replies]
+        types = [reply['type'] for reply in replies]
+        if valid is True:
+            expect(types, ['status', 'order'])
+        elif valid is False:
+            expect(types, ['error'])
+            expect(replies[0]['mismatches'], 1)
+        else:
+            # double submit: first is valid, second is checked against the next order
+            expect(types[:2], ['status', 'order'])
+        orders = [reply['order'] for reply in replies if reply['type'] == 'order']
+        if orders:
+            order = orders[-1]
@@ -0,0 +1,172 @@
+"""Database writes of the live game, off the live path
+
+Live messages are answered from the in-memory game state (see cache.py);
+the writes persisting it are queued here and run by a few background threads,
+so a slow database delays the writes but not the replies.
+Like the event log (see events.py), the threads run the queued writes in batches
+every INTERVAL seconds, or at once when wait() is called, so queueing a write never wakes a thread.
+Writes of one player run one at a time in the order they were queued.
+A failed write is logged and counted, and wait() reports the failures of the key,
+for the caller to write the state again synchronously (see Subsession.leave).
+At most LIVE_WRITE_QUEUE (default 1000) writes are pending; when full, queueing blocks
+the live handler until a write is done, slowing replies down to the pace of the database.
+LIVE_WRITERS sets the number of threads (default 2), 0 runs each write inline when queued.
+The first thread also runs the periodic tasks given to schedule() (see models.sweep);
+without threads, they do not run.
+"""
+import atexit
+import collections
+import logging
+import os
+import threading
+import time
+
+try:
+    from django.db import close_old_connections
+except ImportError:
+    close_old_connections = None
+
+logger = logging.getLogger(__name__)
+
+# seconds between runs of queued writes
+INTERVAL = 0.02
+
+
+class Writer:
+    """Background threads running writes in order per key"""
+
+    def __init__(self, workers=2, max_pending=1000, interval=INTERVAL):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.interval = interval
+        # key -> writes not started yet; a key is present while its writes are queued or running
+        self.queues = {}
+        # keys with writes no thread has taken yet
+        self.ready = collections.deque()
+        # number of writes not started yet
+        self.pending = 0
+        # key -> number of failed writes not reported by wait() yet
+        self.failed = {}
+        self.changed = threading.Condition()
+        self.wake = threading.Event()
+        self.threads = []
+        # [task, period, next monotonic time to run], run by the first thread
+        self.tasks = []
+
+    def submit(self, key, write):
+        """Queues write() after the writes queued before for key
+        Blocks while LIVE_WRITE_QUEUE writes are pending; without threads, runs write() and raises its errors.
+        """
+        if not self.workers:
+            write()
+            return
+        if not self.threads:
+            self.start()
+        with self.changed:
+            # a periodic task queueing writes must not wait for its own thread
+            if self.pending >= self.max_pending and threading.current_thread() not in self.threads:
+                self.wake.set()
+                self.changed.wait_for(lambda: self.pending < self.max_pending)
+            queue = self.queues.get(key)
+            if queue is None:
+                queue = self.queues[key] = collections.deque()
+                self.ready.append(key)
+            queue.append(write)
+            self.pending += 1
+
+    def schedule(self, task, period):
+        """Runs task() every period seconds on the first thread, from the first write queued on"""
+        with self.changed:
+            self.tasks.append([task, period, time.monotonic() + period])
+
+    def start(self):
+        with self.changed:
+            while len(self.threads) < self.workers:
+                thread = threading.Thread(target=self.run, args=(not self.threads,),
+                                          name=f"live-writer-{len(self.threads)}", daemon=True)
+                thread.start()
+                self.threads.append(thread)
+
+    def run(self, first=False):
+        while True:
+            self.wake.wait(self.interval)
+            self.wake.clear()
+            if first:
+                self.run_tasks()
+            while True:
+                with self.changed:
+                    key = self.ready.popleft() if self.ready else None
+                if key is None:
+                    break
+                self.drain(key)
+            if close_old_connections is not None:
+                close_old_connections()
+
+    def run_tasks(self):
+        now = time.monotonic()
+        with self.changed:
+            due = [entry for entry in self.tasks if entry[2] <= now]
+            for entry in due:
+                entry[2] = now + entry[1]
+        for task, _, _ in due:
+            try:
+                task()
+            except Exception:
+                logger.exception("live writer task %s failed", task.__name__)
+
+    def drain(self, key):
+        """Runs the writes of key until none is left"""
+        failed = 0
+        while True:
+            with self.changed:
+                queue = self.queues[key]
+                if not queue:
+                    del self.queues[key]
+                    if failed:
+                        self.failed[key] = self.failed.get(key, 0) + failed
+                    self.changed.notify_all()
+                    return
+                write = queue.popleft()
+                if self.pending == self.max_pending:
+                    self.changed.notify_all()
+                self.pending -= 1
+            try:
+                write()
+            except Exception:
+                logger.exception("live write of %s failed", key)
+                failed += 1
+
+    def wait(self, key=None, timeout=None):
+        """Waits until the writes of key (default: all) are done
+        Returns: number of those writes that failed since the last wait
+        Raises TimeoutError if they are not done within timeout
+        """
+        self.wake.set()
+        with self.changed:
+            if not self.changed.wait_for(
+                    lambda: not self.queues if key is None else key not in self.queues, timeout):
+                raise TimeoutError(f"live writes not done within {timeout}s")
+            if key is None:
+                failed = sum(self.failed.values())
+                self.failed.clear()
+                return failed
+            return self.failed.pop(key, 0)
+
+    def close(self, timeout=10):
+        """Waits for the pending writes, logging those lost"""
+        try:
+            failed = self.wait(timeout=timeout)
+        except TimeoutError:
+            logger.error("%d players with live writes pending at exit", len(self))
+        else:
+            if failed:
+                logger.error("%d live writes failed", failed)
+
+    def __len__(self):
+        with self.changed:
+            return len(self.queues)
+
+
+WRITER = Writer(int(os.environ.get("LIVE_WRITERS", 2)), int(os.environ.get("LIVE_WRITE_QUEUE", 1000)))
+
+atexit.register(WRITER.close)
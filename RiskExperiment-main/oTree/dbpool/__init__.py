@@ -0,0 +1,16 @@
+"""Postgres database backend keeping a pool of connections per process
+
+Django opens a connection per request and closes it at the end (CONN_MAX_AGE=0),
+or keeps one per thread (CONN_MAX_AGE>0). With this backend, closing returns the connection
+to a bounded pool shared by the threads of the worker, and opening takes one from it,
+so requests and live messages do not pay for connection setup.
+A thread holds the connection it opened until it closes it; connections of threads
+that ended without closing theirs are closed and their slots reused once the pool is exhausted.
+
+Configured by settings.py from the environment, see there.
+Pool options are given in the POOL entry of the database settings:
+
+    size          maximal number of connections of the process, at least one per thread using the database
+    timeout       seconds to wait for a free connection before failing
+    check_after   seconds a connection may be idle before it is checked with SELECT 1 on reuse
+"""
@@ -0,0 +1,146 @@
+import threading
+import time
+
+import psycopg2 as Database
+import psycopg2.extras
+from psycopg2 import extensions
+from django.db.backends.postgresql import base
+
+DEFAULTS = dict(size=10, timeout=10.0, check_after=30.0)
+
+
+class Pool:
+    """Bounded pool of psycopg2 connections; checkout blocks while all are in use
+    Connections of threads that ended without closing them are closed and their slots reused
+    when the pool runs out of slots.
+    """
+
+    def __init__(self, params, size, timeout, check_after):
+        self.params = params
+        self.size = size
+        self.timeout = timeout
+        self.check_after = check_after
+        # idle connections with the time they were returned, most recent last
+        self.idle = []
+        # connections checked out -> thread holding it
+        self.used = {}
+        self.slots = threading.BoundedSemaphore(size)
+        self.lock = threading.Lock()
+
+    def checkout(self):
+        if not self.slots.acquire(blocking=False):
+            self.reclaim()
+            if not self.slots.acquire(timeout=self.timeout):
+                raise Database.OperationalError(
+                    f"no database connection free within {self.timeout}s (pool size {self.size})")
+        try:
+            connection = self.take()
+        except BaseException:
+            self.slots.release()
+            raise
+        with self.lock:
+            self.used[connection] = threading.current_thread()
+        return connection
+
+    def take(self):
+        """Returns: a usable idle connection, or a new one"""
+        while True:
+            with self.lock:
+                connection, returned = self.idle.pop() if self.idle else (None, None)
+            if connection is None:
+                return Database.connect(**self.params)
+            if connection.closed:
+                continue
+            if self.check_after is not None and time.monotonic() - returned >= self.check_after:
+                if not self.usable(connection):
+                    connection.close()
+                    continue
+            return connection
+
+    def checkin(self, connection):
+        with self.lock:
+            if self.used.pop(connection, None) is None:
+                # reclaimed already
+                return
+        try:
+            if connection.closed:
+                return
+            status = connection.info.transaction_status
+            if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                # connection lost
+                connection.close()
+                return
+            if status != extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+            with self.lock:
+                self.idle.append((connection, time.monotonic()))
+        finally:
+            self.slots.release()
+
+    def reclaim(self):
+        """Closes the connections of threads that ended without closing them, freeing their slots"""
+        with self.lock:
+            orphans = [connection for connection, thread in self.used.items() if not thread.is_alive()]
+            for connection in orphans:
+                del self.used[connection]
+        for connection in orphans:
+            try:
+                connection.close()
+            finally:
+                self.slots.release()
+
+    def usable(self, connection):
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if not connection.autocommit:
+                connection.rollback()
+            return True
+        except Database.Error:
+            return False
+
+    def close(self):
+        """Closes idle connections"""
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for connection, _ in idle:
+            connection.close()
+
+
+# database alias -> pool
+POOLS = {}
+POOLS_LOCK = threading.Lock()
+
+
+def pool_for(alias, settings_dict, params):
+    with POOLS_LOCK:
+        pool = POOLS.get(alias)
+        if pool is None:
+            options = dict(DEFAULTS, **settings_dict.get('POOL', {}))
+            pool = POOLS[alias] = Pool(params, **options)
+        return pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """Postgres backend taking connections from the pool of the process and returning them on close"""
+
+    def get_new_connection(self, conn_params):
+        """The connection setup of the postgresql backend, on a connection of the pool"""
+        connection = pool_for(self.alias, self.settings_dict, conn_params).checkout()
+        options = self.settings_dict['OPTIONS']
+        try:
+            self.isolation_level = options['isolation_level']
+        except KeyError:
+            self.isolation_level = connection.isolation_level
+        else:
+            if self.isolation_level != connection.isolation_level:
+                connection.set_session(isolation_level=self.isolation_level)
+        # as the postgresql backend: jsonb values are returned undecoded, JSONField decodes them;
+        # repeated on reused connections, it only sets a type caster of the connection
+        psycopg2.extras.register_default_jsonb(conn_or_curs=connection, loads=lambda x: x)
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                POOLS[self.alias].checkin(self.connection)
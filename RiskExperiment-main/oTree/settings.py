@@ -1,3 +1,4 @@
+import os
 from os import environ
 
 SESSION_CONFIGS = [
@@ -21,7 +22,11 @@ SESSION_CONFIGS = [
 # e.g. self.session.config['participation_fee']
 
 SESSION_CONFIG_DEFAULTS = dict(
-    real_world_currency_per_point=1.00, participation_fee=0.00, doc=""
+    real_world_currency_per_point=1.00, participation_fee=0.00, doc="",
+    # shop manager metrics are written every flush_every sandwiches, within about flush_interval seconds
+    # of a sandwich not written yet (also for players who closed the page), and when the page is submitted;
+    # flush_every=1 writes on every sandwich
+    flush_every=20, flush_interval=10,
 )
 
 # ISO-639 code
@@ -48,3 +53,35 @@ SECRET_KEY = 'dkz6yndxn3mo9v-ax$1%$0u&_l@$#+ze7-99(_*c5vj@ruy!yz'
 
 # if an app is included in SESSION_CONFIGS, you don't need to list it here
 INSTALLED_APPS = ['otree']
+
+# content-hashed static files (e.g. the sandwich menu bundle) never change,
+# so they are served with far-future cache headers
+WHITENOISE_IMMUTABLE_FILE_TEST = r'^.+\.[0-9a-f]{12}\..+$'
+
+# Postgres (DATABASE_URL=postgres://...) connections are pooled per worker process, see dbpool/.
+# DB_POOL_SIZE: connections per process, shared by request threads and the live writer threads;
+# default: one per thread, ASGI_THREADS (as sized by asgiref: CPUs + 4, at most 32)
+# plus LIVE_WRITERS (default 2, see BaseExperiment/writer.py),
+# DB_POOL_TIMEOUT: seconds to wait for a free connection (default 10),
+# DB_HEALTH_CHECK: seconds a connection may be idle before it is checked on reuse (default 30),
+# DB_POOL=0: no pool, a connection per request or kept for DB_CONN_MAX_AGE seconds per thread.
+# DB_PGBOUNCER=1 when connecting through pgbouncer in transaction pooling mode:
+# server-side cursors are not used, as they do not survive the end of a transaction there
+# (QuerySet.iterator then loads the whole result, the data export reads chunks by id instead).
+DATABASE_URL = environ.get('DATABASE_URL', '')
+if DATABASE_URL.startswith('postgres'):
+    import dj_database_url
+
+    DATABASES = {'default': dj_database_url.parse(DATABASE_URL)}
+    if environ.get('DB_POOL', '1') != '0':
+        threads = int(environ.get('ASGI_THREADS', min(32, (os.cpu_count() or 1) + 4)))
+        threads += int(environ.get('LIVE_WRITERS', 2))
+        DATABASES['default'].update(ENGINE='dbpool', POOL=dict(
+            size=int(environ.get('DB_POOL_SIZE', threads)),
+            timeout=float(environ.get('DB_POOL_TIMEOUT', 10)),
+            check_after=float(environ.get('DB_HEALTH_CHECK', 30)),
+        ))
+    else:
+        DATABASES['default']['CONN_MAX_AGE'] = int(environ.get('DB_CONN_MAX_AGE', 0))
+    if environ.get('DB_PGBOUNCER') == '1':
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True